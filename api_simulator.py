@@ -4,444 +4,612 @@ GAMS API Simulator
 
 This script creates a simple Flask server to simulate the backend API endpoints
 for testing the GAMS Operator Dashboard.
+
+For anything beyond local development, run it under Gunicorn:
+
+    gunicorn -c gunicorn_conf.py "api_simulator:create_app()"
 """
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Blueprint, Flask, current_app, request, send_from_directory
+from flask.json.provider import JSONProvider
 # Removed CORS dependency for compatibility
 import os
 import json
 import random
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import uuid
+import hashlib
+import threading
+from collections import defaultdict
 import time
 
-app = Flask(__name__)
+import numpy as np
+import orjson
+
+# WhiteNoise is optional; without it static files go through Flask
+try:
+    from whitenoise import WhiteNoise
+    WHITENOISE_AVAILABLE = True
+except ImportError:
+    WHITENOISE_AVAILABLE = False
+
+# orjson serializes datetimes natively (RFC 3339) and numpy scalars/arrays
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson so jsonify/get_json skip the stdlib encoder."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype="application/json")
+
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend')
+DASHBOARD_FILE = 'enhanced_operator_dashboard.html'
+
+# All routes live on a blueprint so create_app() controls when the dataset is built
+bp = Blueprint("simulator", __name__)
+
+# Performance reports are cached as serialized bytes per (start_date, end_date)
+REPORT_CACHE_TTL = 5.0
+REPORT_CACHE_MAX_ENTRIES = 128
+_report_cache = {}
+
+# Response timestamp as [epoch second, ISO string]; a racing recompute is harmless
+_timestamp_cache = [0, ""]
+
+# Report time-series dates, shared by every report generated on the same day
+_dates_cache = {"day": None, "dates": None}
+
+# Pre-serialized bodies and ETags for the list endpoints, keyed by collection name
+_list_cache = {}
+
+
+def fast_jsonify(obj):
+    """Serialize obj with orjson straight into a JSON response."""
+    return current_app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype="application/json")
+
+def iso_now():
+    """Return the current local time as an ISO string, rebuilt at most once per second."""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.fromtimestamp(now).isoformat()
+    return _timestamp_cache[1]
+
+def cached_list_response(key):
+    """Return data[key] from a pre-serialized body, or 304 if the client's ETag still matches."""
+    entry = _list_cache.get(key)
+    if entry is None:
+        # Serialize and store under the lock so a concurrent write cannot
+        # land in between and leave a stale body cached
+        with data_lock:
+            entry = _list_cache.get(key)
+            if entry is None:
+                records = data[key]
+                if isinstance(records, dict):
+                    records = list(records.values())
+                body = orjson.dumps({key: records}, option=ORJSON_OPTIONS)
+                entry = {"body": body, "etag": hashlib.blake2b(body, digest_size=8).hexdigest()}
+                _list_cache[key] = entry
+    
+    if entry["etag"] in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(entry["body"], mimetype="application/json")
+    response.set_etag(entry["etag"])
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+def invalidate_list(key):
+    """Drop the pre-serialized body for data[key] after it has been mutated."""
+    _list_cache.pop(key, None)
+
 # Adding CORS headers manually
-@app.after_request
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,Authorization',
+    'Access-Control-Allow-Methods': 'GET,PUT,POST,DELETE,OPTIONS'
+}
+PREFLIGHT_HEADERS = {**CORS_HEADERS, 'Access-Control-Max-Age': '86400'}
+
+@bp.before_app_request
+def answer_preflight():
+    # Preflights never need the view; answer them before dispatch
+    if request.method == 'OPTIONS':
+        return current_app.response_class(status=204, headers=PREFLIGHT_HEADERS)
+
+@bp.after_app_request
 def add_cors_headers(response):
-    response.headers['Access-Control-Allow-Origin'] = '*'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type,Authorization'
-    response.headers['Access-Control-Allow-Methods'] = 'GET,PUT,POST,DELETE,OPTIONS'
+    response.headers.update(CORS_HEADERS)
     return response
 
-# Simulated data storage
-data = {
-    "system_status": "stopped",
-    "start_time": None,
-    "metrics": {
-        "page_views": random.randint(1000, 10000),
-        "conversions": random.randint(50, 500),
-        "revenue": round(random.uniform(1000, 10000), 2),
-        "engagement_rate": round(random.uniform(0.1, 0.5), 2)
-    },
-    "content_performance": [
-        {
-            "url": "/homepage",
-            "page_views": random.randint(500, 2000),
-            "bounce_rate": round(random.uniform(0.2, 0.6), 2),
-            "avg_time_on_page": round(random.uniform(30, 180), 1),
-            "conversion_rate": round(random.uniform(0.01, 0.1), 3),
-            "engagement_rate": round(random.uniform(0.1, 0.5), 2)
-        },
-        {
-            "url": "/products",
-            "page_views": random.randint(300, 1500),
-            "bounce_rate": round(random.uniform(0.2, 0.6), 2),
-            "avg_time_on_page": round(random.uniform(30, 180), 1),
-            "conversion_rate": round(random.uniform(0.01, 0.1), 3),
-            "engagement_rate": round(random.uniform(0.1, 0.5), 2)
-        },
-        {
-            "url": "/blog",
-            "page_views": random.randint(200, 1000),
-            "bounce_rate": round(random.uniform(0.2, 0.6), 2),
-            "avg_time_on_page": round(random.uniform(30, 180), 1),
-            "conversion_rate": round(random.uniform(0.01, 0.1), 3),
-            "engagement_rate": round(random.uniform(0.1, 0.5), 2)
-        },
-        {
-            "url": "/contact",
-            "page_views": random.randint(100, 500),
-            "bounce_rate": round(random.uniform(0.2, 0.6), 2),
-            "avg_time_on_page": round(random.uniform(30, 180), 1),
-            "conversion_rate": round(random.uniform(0.01, 0.1), 3),
-            "engagement_rate": round(random.uniform(0.1, 0.5), 2)
-        }
-    ],
-    "recommendations": [
-        {
-            "id": str(uuid.uuid4()),
-            "type": "content",
-            "title": "Optimize homepage call-to-action",
-            "description": "The main CTA on the homepage has a low click-through rate. Consider testing alternative copy and design.",
-            "impact": "high",
-            "effort": "medium"
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "type": "seo",
-            "title": "Improve blog post meta descriptions",
-            "description": "Several blog posts have generic meta descriptions. Update them to improve CTR from search results.",
-            "impact": "medium",
-            "effort": "low"
+# Improvement cycle phases in order, with precomputed position and successor
+PHASES = (
+    "website_optimization",
+    "multi_channel_marketing",
+    "data_learning",
+    "content_refinement",
+    "revenue_optimization",
+    "system_expansion"
+)
+PHASE_INDEX = {phase: i for i, phase in enumerate(PHASES)}
+NEXT_PHASE = {phase: PHASES[i + 1] for i, phase in enumerate(PHASES[:-1])}
+
+VALID_CAMPAIGN_STATUSES = frozenset({"active", "paused", "completed", "cancelled"})
+# Approval action -> resulting approval status
+APPROVAL_ACTION_STATUSES = {"approve": "approved", "reject": "rejected"}
+
+# Per-tick random walk for content metrics: (field, delta_low, delta_high, min, max, decimals)
+CONTENT_RATE_FIELDS = (
+    ("bounce_rate", -0.05, 0.05, 0.1, 0.8, 2),
+    ("avg_time_on_page", -10, 10, 10, 300, 1),
+    ("conversion_rate", -0.005, 0.005, 0.005, 0.2, 3),
+    ("engagement_rate", -0.02, 0.02, 0.05, 0.6, 2)
+)
+
+# Per-request metric deltas for (page_views, conversions, revenue_cents, engagement_pct)
+METRIC_DELTA_LOWS = np.array([-100, -5, -10000, -2])
+METRIC_DELTA_HIGHS = np.array([201, 16, 30001, 3])
+
+# Bounds for the simulated report scalars, listed in the order the report consumes them
+REPORT_INT_BOUNDS = (
+    (10000, 50000),  # summary.total_page_views
+    (500, 2000),  # summary.total_conversions
+    (10000, 50000),  # traffic.total
+    (500, 2000)  # conversions.total
+)
+REPORT_FLOAT_BOUNDS = (
+    (10000, 50000, 2),  # summary.total_revenue
+    (0.1, 0.4, 2),  # summary.avg_engagement_rate
+    (0.3, 0.5, 2),  # traffic.sources.organic
+    (0.1, 0.3, 2),  # traffic.sources.direct
+    (0.1, 0.2, 2),  # traffic.sources.referral
+    (0.05, 0.15, 2),  # traffic.sources.social
+    (0.05, 0.1, 2),  # traffic.sources.email
+    (0.01, 0.05, 2),  # traffic.sources.other
+    (0.01, 0.05, 3),  # conversions.rate
+    (0.01, 0.04, 3),  # conversions.by_source.organic
+    (0.02, 0.06, 3),  # conversions.by_source.direct
+    (0.015, 0.05, 3),  # conversions.by_source.referral
+    (0.01, 0.03, 3),  # conversions.by_source.social
+    (0.03, 0.08, 3),  # conversions.by_source.email
+    (120, 300, 1),  # engagement.avg_time_on_site
+    (1.5, 4.0, 1),  # engagement.pages_per_session
+    (0.3, 0.6, 2),  # engagement.bounce_rate
+    (10000, 50000, 2),  # revenue.total
+    (50, 150, 2),  # revenue.average_order_value
+    (2000, 10000, 2),  # revenue.by_channel.organic
+    (3000, 15000, 2),  # revenue.by_channel.direct
+    (1000, 5000, 2),  # revenue.by_channel.referral
+    (500, 3000, 2),  # revenue.by_channel.social
+    (1500, 8000, 2)  # revenue.by_channel.email
+)
+REPORT_INT_LOWS = np.array([low for low, _ in REPORT_INT_BOUNDS])
+REPORT_INT_HIGHS = np.array([high + 1 for _, high in REPORT_INT_BOUNDS])
+REPORT_FLOAT_LOWS = np.array([low for low, _, _ in REPORT_FLOAT_BOUNDS], dtype=np.float64)
+REPORT_FLOAT_HIGHS = np.array([high for _, high, _ in REPORT_FLOAT_BOUNDS], dtype=np.float64)
+REPORT_FLOAT_SCALES = np.array([10.0 ** decimals for _, _, decimals in REPORT_FLOAT_BOUNDS])
+
+rng = np.random.default_rng()
+
+# Guards mutations of the shared simulated state when served by threaded workers
+data_lock = threading.Lock()
+
+def content_to_columns(rows):
+    """Convert a list of content rows into parallel NumPy columns."""
+    columns = {
+        "url": [row["url"] for row in rows],
+        "page_views": np.array([row["page_views"] for row in rows], dtype=np.int64)
+    }
+    for field, *_ in CONTENT_RATE_FIELDS:
+        columns[field] = np.array([row[field] for row in rows], dtype=np.float64)
+    return columns
+
+def content_to_rows(columns):
+    """Convert NumPy content columns back into a list of JSON-ready rows."""
+    fields = ["page_views"] + [field for field, *_ in CONTENT_RATE_FIELDS]
+    values = [columns[field].tolist() for field in fields]
+    return [{"url": url, **dict(zip(fields, row))} for url, *row in zip(columns["url"], *values)]
+
+def build_initial_data():
+    """Generate the simulated dataset served by the API."""
+    initial = {
+        "system_status": "stopped",
+        "start_time": None,
+        "_start_monotonic": None,
+        # Revenue is tracked in cents and engagement in hundredths to keep updates integral
+        "metrics": {
+            "page_views": random.randint(1000, 10000),
+            "conversions": random.randint(50, 500),
+            "revenue_cents": random.randint(100000, 1000000),
+            "engagement_pct": random.randint(10, 50)
         },
-        {
-            "id": str(uuid.uuid4()),
-            "type": "conversion",
-            "title": "Simplify checkout process",
-            "description": "Users are abandoning carts during the checkout process. Reduce the number of steps required.",
-            "impact": "high",
-            "effort": "high"
-        }
-    ],
-    "cycles": [
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Q2 Growth Initiative",
-            "current_phase": "website_optimization",
-            "start_time": (datetime.now() - timedelta(days=5)).isoformat(),
-            "last_phase_change": (datetime.now() - timedelta(days=2)).isoformat(),
-            "status": "active"
-        }
-    ],
-    "goals": [
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Increase Conversion Rate",
-            "type": "conversion",
-            "target": "Improve conversion rate by 15%",
-            "status": "active",
-            "metrics": {
-                "conversion_rate": 0.032,
-                "target_rate": 0.035,
-                "progress": 0.65
+        "content_performance": [
+            {
+                "url": "/homepage",
+                "page_views": random.randint(500, 2000),
+                "bounce_rate": round(random.uniform(0.2, 0.6), 2),
+                "avg_time_on_page": round(random.uniform(30, 180), 1),
+                "conversion_rate": round(random.uniform(0.01, 0.1), 3),
+                "engagement_rate": round(random.uniform(0.1, 0.5), 2)
+            },
+            {
+                "url": "/products",
+                "page_views": random.randint(300, 1500),
+                "bounce_rate": round(random.uniform(0.2, 0.6), 2),
+                "avg_time_on_page": round(random.uniform(30, 180), 1),
+                "conversion_rate": round(random.uniform(0.01, 0.1), 3),
+                "engagement_rate": round(random.uniform(0.1, 0.5), 2)
+            },
+            {
+                "url": "/blog",
+                "page_views": random.randint(200, 1000),
+                "bounce_rate": round(random.uniform(0.2, 0.6), 2),
+                "avg_time_on_page": round(random.uniform(30, 180), 1),
+                "conversion_rate": round(random.uniform(0.01, 0.1), 3),
+                "engagement_rate": round(random.uniform(0.1, 0.5), 2)
+            },
+            {
+                "url": "/contact",
+                "page_views": random.randint(100, 500),
+                "bounce_rate": round(random.uniform(0.2, 0.6), 2),
+                "avg_time_on_page": round(random.uniform(30, 180), 1),
+                "conversion_rate": round(random.uniform(0.01, 0.1), 3),
+                "engagement_rate": round(random.uniform(0.1, 0.5), 2)
             }
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Boost Organic Traffic",
-            "type": "traffic",
-            "target": "Increase organic traffic by 25%",
-            "status": "at_risk",
-            "metrics": {
-                "organic_sessions": 12500,
-                "target_sessions": 15000,
-                "progress": 0.42
+        ],
+        "recommendations": [
+            {
+                "id": str(uuid.uuid4()),
+                "type": "content",
+                "title": "Optimize homepage call-to-action",
+                "description": "The main CTA on the homepage has a low click-through rate. Consider testing alternative copy and design.",
+                "impact": "high",
+                "effort": "medium"
+            },
+            {
+                "id": str(uuid.uuid4()),
+                "type": "seo",
+                "title": "Improve blog post meta descriptions",
+                "description": "Several blog posts have generic meta descriptions. Update them to improve CTR from search results.",
+                "impact": "medium",
+                "effort": "low"
+            },
+            {
+                "id": str(uuid.uuid4()),
+                "type": "conversion",
+                "title": "Simplify checkout process",
+                "description": "Users are abandoning carts during the checkout process. Reduce the number of steps required.",
+                "impact": "high",
+                "effort": "high"
             }
-        }
-    ],
-    "campaigns": [
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Summer Product Launch",
-            "type": "multi-channel",
-            "status": "active",
-            "goal_id": None,  # Will be set to a real goal ID
-            "metrics": {
-                "impressions": 45000,
-                "clicks": 3200,
-                "conversions": 128,
-                "revenue": 12800.00,
-                "roi": 3.2
+        ],
+        "cycles": [
+            {
+                "id": str(uuid.uuid4()),
+                "name": "Q2 Growth Initiative",
+                "current_phase": "website_optimization",
+                "start_time": (datetime.now() - timedelta(days=5)).isoformat(),
+                "last_phase_change": (datetime.now() - timedelta(days=2)).isoformat(),
+                "status": "active"
             }
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "name": "Email Re-engagement",
-            "type": "email",
-            "status": "paused",
-            "goal_id": None,  # Will be set to a real goal ID
-            "metrics": {
-                "sent": 10000,
-                "opens": 2200,
-                "clicks": 450,
-                "conversions": 28,
-                "revenue": 1400.00
+        ],
+        "goals": [
+            {
+                "id": str(uuid.uuid4()),
+                "name": "Increase Conversion Rate",
+                "type": "conversion",
+                "target": "Improve conversion rate by 15%",
+                "status": "active",
+                "metrics": {
+                    "conversion_rate": 0.032,
+                    "target_rate": 0.035,
+                    "progress": 0.65
+                }
+            },
+            {
+                "id": str(uuid.uuid4()),
+                "name": "Boost Organic Traffic",
+                "type": "traffic",
+                "target": "Increase organic traffic by 25%",
+                "status": "at_risk",
+                "metrics": {
+                    "organic_sessions": 12500,
+                    "target_sessions": 15000,
+                    "progress": 0.42
+                }
             }
-        }
-    ],
-    "approvals": [
-        {
-            "id": str(uuid.uuid4()),
-            "type": "content",
-            "title": "New Blog Post: '10 Tips for SEO Success'",
-            "status": "pending",
-            "created_at": (datetime.now() - timedelta(hours=6)).isoformat(),
-            "description": "A new blog post focusing on SEO best practices."
-        },
-        {
-            "id": str(uuid.uuid4()),
-            "type": "campaign",
-            "title": "Holiday Promotion Email Sequence",
-            "status": "pending",
-            "created_at": (datetime.now() - timedelta(hours=2)).isoformat(),
-            "description": "A series of 3 emails promoting holiday specials."
-        }
-    ]
-}
+        ],
+        "campaigns": [
+            {
+                "id": str(uuid.uuid4()),
+                "name": "Summer Product Launch",
+                "type": "multi-channel",
+                "status": "active",
+                "goal_id": None,  # Will be set to a real goal ID
+                "metrics": {
+                    "impressions": 45000,
+                    "clicks": 3200,
+                    "conversions": 128,
+                    "revenue": 12800.00,
+                    "roi": 3.2
+                }
+            },
+            {
+                "id": str(uuid.uuid4()),
+                "name": "Email Re-engagement",
+                "type": "email",
+                "status": "paused",
+                "goal_id": None,  # Will be set to a real goal ID
+                "metrics": {
+                    "sent": 10000,
+                    "opens": 2200,
+                    "clicks": 450,
+                    "conversions": 28,
+                    "revenue": 1400.00
+                }
+            }
+        ],
+        "approvals": [
+            {
+                "id": str(uuid.uuid4()),
+                "type": "content",
+                "title": "New Blog Post: '10 Tips for SEO Success'",
+                "status": "pending",
+                "created_at": (datetime.now() - timedelta(hours=6)).isoformat(),
+                "description": "A new blog post focusing on SEO best practices."
+            },
+            {
+                "id": str(uuid.uuid4()),
+                "type": "campaign",
+                "title": "Holiday Promotion Email Sequence",
+                "status": "pending",
+                "created_at": (datetime.now() - timedelta(hours=2)).isoformat(),
+                "description": "A series of 3 emails promoting holiday specials."
+            }
+        ]
+    }
+
+    # Content metrics are stored column-wise so each tick is a few array operations
+    initial["content_performance"] = content_to_columns(initial["content_performance"])
+
+    # Pending approvals are keyed by id (insertion-ordered) so processing one is O(1)
+    initial["approvals"] = {approval["id"]: approval for approval in initial["approvals"]}
+
+    # Link campaigns to goals
+    initial["campaigns"][0]["goal_id"] = initial["goals"][0]["id"]
+    initial["campaigns"][1]["goal_id"] = initial["goals"][1]["id"]
+    return initial
 
-# Link campaigns to goals
-data["campaigns"][0]["goal_id"] = data["goals"][0]["id"]
-data["campaigns"][1]["goal_id"] = data["goals"][1]["id"]
+# Simulated data storage, populated by init_data()
+data = {}
+
+# Id indexes over the simulated collections for O(1) lookups
+_cycles_by_id = {}
+_goals_by_id = {}
+_campaigns_by_id = {}
+_campaigns_by_goal = defaultdict(list)
+
+def rebuild_indexes():
+    """Rebuild the id indexes from the current contents of data."""
+    _cycles_by_id.clear()
+    _cycles_by_id.update((c["id"], c) for c in data["cycles"])
+    _goals_by_id.clear()
+    _goals_by_id.update((g["id"], g) for g in data["goals"])
+    _campaigns_by_id.clear()
+    _campaigns_by_id.update((c["id"], c) for c in data["campaigns"])
+    _campaigns_by_goal.clear()
+    for campaign in data["campaigns"]:
+        _campaigns_by_goal[campaign["goal_id"]].append(campaign)
+
+def init_data():
+    """(Re)generate the simulated dataset, its indexes and drop any cached responses."""
+    with data_lock:
+        data.clear()
+        data.update(build_initial_data())
+        rebuild_indexes()
+        _list_cache.clear()
+        _report_cache.clear()
 
 # System control endpoints
-@app.route('/api/operator/control/status', methods=['GET'])
+@bp.route('/api/operator/control/status', methods=['GET'])
 def get_status():
-    return jsonify({
+    return fast_jsonify({
         "status": data["system_status"],
         "start_time": data["start_time"],
-        "uptime": calculate_uptime() if data["start_time"] else 0,
+        "uptime": calculate_uptime(),
         "version": "1.0.0"
     })
 
-@app.route('/api/operator/control/start', methods=['POST'])
+@bp.route('/api/operator/control/start', methods=['POST'])
 def start_system():
-    data["system_status"] = "running"
-    data["start_time"] = datetime.now().isoformat()
-    return jsonify({"status": "success", "message": "GAMS system started successfully"})
+    with data_lock:
+        data["system_status"] = "running"
+        data["start_time"] = datetime.now().isoformat()
+        data["_start_monotonic"] = time.monotonic()
+    return fast_jsonify({"status": "success", "message": "GAMS system started successfully"})
 
-@app.route('/api/operator/control/stop', methods=['POST'])
+@bp.route('/api/operator/control/stop', methods=['POST'])
 def stop_system():
-    data["system_status"] = "stopped"
-    return jsonify({"status": "success", "message": "GAMS system stopped successfully"})
+    with data_lock:
+        data["system_status"] = "stopped"
+    return fast_jsonify({"status": "success", "message": "GAMS system stopped successfully"})
 
 # Analytics endpoints
-@app.route('/api/operator/analytics/metrics', methods=['GET'])
+@bp.route('/api/operator/analytics/metrics', methods=['GET'])
 def get_metrics():
     # Simulate changing metrics
-    data["metrics"]["page_views"] += random.randint(-100, 200)
-    data["metrics"]["conversions"] += random.randint(-5, 15)
-    data["metrics"]["revenue"] += round(random.uniform(-100, 300), 2)
-    data["metrics"]["engagement_rate"] = round(min(0.5, max(0.1, data["metrics"]["engagement_rate"] + random.uniform(-0.02, 0.02))), 2)
-    
-    return jsonify({
-        "metrics": data["metrics"],
-        "timestamp": datetime.now().isoformat()
-    })
+    page_views_delta, conversions_delta, revenue_delta, engagement_delta = rng.integers(METRIC_DELTA_LOWS, METRIC_DELTA_HIGHS).tolist()
+    with data_lock:
+        metrics = data["metrics"]
+        metrics["page_views"] += page_views_delta
+        metrics["conversions"] += conversions_delta
+        metrics["revenue_cents"] += revenue_delta
+        metrics["engagement_pct"] = max(10, min(50, metrics["engagement_pct"] + engagement_delta))
+        
+        return fast_jsonify({
+            "metrics": {
+                "page_views": metrics["page_views"],
+                "conversions": metrics["conversions"],
+                "revenue": metrics["revenue_cents"] / 100,
+                "engagement_rate": metrics["engagement_pct"] / 100
+            },
+            "timestamp": iso_now()
+        })
 
-@app.route('/api/operator/analytics/content', methods=['GET'])
+@bp.route('/api/operator/analytics/content', methods=['GET'])
 def get_content_performance():
     # Simulate changing content performance
-    for content in data["content_performance"]:
-        content["page_views"] += random.randint(-20, 50)
-        content["bounce_rate"] = round(min(0.8, max(0.1, content["bounce_rate"] + random.uniform(-0.05, 0.05))), 2)
-        content["avg_time_on_page"] = round(min(300, max(10, content["avg_time_on_page"] + random.uniform(-10, 10))), 1)
-        content["conversion_rate"] = round(min(0.2, max(0.005, content["conversion_rate"] + random.uniform(-0.005, 0.005))), 3)
-        content["engagement_rate"] = round(min(0.6, max(0.05, content["engagement_rate"] + random.uniform(-0.02, 0.02))), 2)
+    content = data["content_performance"]
+    n = len(content["url"])
+    with data_lock:
+        content["page_views"] += rng.integers(-20, 51, n)
+        for field, delta_low, delta_high, low, high, decimals in CONTENT_RATE_FIELDS:
+            column = content[field]
+            column += rng.uniform(delta_low, delta_high, n)
+            np.clip(column, low, high, out=column)
+            np.round(column, decimals, out=column)
+        rows = content_to_rows(content)
     
-    return jsonify({
-        "content": data["content_performance"],
-        "timestamp": datetime.now().isoformat()
-    })
-
-@app.route('/api/operator/analytics/recommendations', methods=['GET'])
-def get_recommendations():
-    return jsonify({
-        "recommendations": data["recommendations"],
-        "timestamp": datetime.now().isoformat()
+    return fast_jsonify({
+        "content": rows,
+        "timestamp": iso_now()
     })
 
-@app.route('/api/operator/analytics/report', methods=['GET'])
+@bp.route('/api/operator/analytics/report', methods=['GET'])
 def get_performance_report():
     start_date = request.args.get('start_date', default=None)
     end_date = request.args.get('end_date', default=None)
     
-    # Generate simulated report data
-    report_data = {
-        "summary": {
-            "period": f"{start_date} to {end_date}" if start_date and end_date else "Last 30 days",
-            "total_page_views": random.randint(10000, 50000),
-            "total_conversions": random.randint(500, 2000),
-            "total_revenue": round(random.uniform(10000, 50000), 2),
-            "avg_engagement_rate": round(random.uniform(0.1, 0.4), 2)
-        },
-        "traffic": {
-            "total": random.randint(10000, 50000),
-            "sources": {
-                "organic": round(random.uniform(0.3, 0.5), 2),
-                "direct": round(random.uniform(0.1, 0.3), 2),
-                "referral": round(random.uniform(0.1, 0.2), 2),
-                "social": round(random.uniform(0.05, 0.15), 2),
-                "email": round(random.uniform(0.05, 0.1), 2),
-                "other": round(random.uniform(0.01, 0.05), 2)
-            }
-        },
-        "conversions": {
-            "total": random.randint(500, 2000),
-            "rate": round(random.uniform(0.01, 0.05), 3),
-            "by_source": {
-                "organic": round(random.uniform(0.01, 0.04), 3),
-                "direct": round(random.uniform(0.02, 0.06), 3),
-                "referral": round(random.uniform(0.015, 0.05), 3),
-                "social": round(random.uniform(0.01, 0.03), 3),
-                "email": round(random.uniform(0.03, 0.08), 3)
-            }
-        },
-        "engagement": {
-            "avg_time_on_site": round(random.uniform(120, 300), 1),
-            "pages_per_session": round(random.uniform(1.5, 4.0), 1),
-            "bounce_rate": round(random.uniform(0.3, 0.6), 2)
-        },
-        "revenue": {
-            "total": round(random.uniform(10000, 50000), 2),
-            "average_order_value": round(random.uniform(50, 150), 2),
-            "by_channel": {
-                "organic": round(random.uniform(2000, 10000), 2),
-                "direct": round(random.uniform(3000, 15000), 2),
-                "referral": round(random.uniform(1000, 5000), 2),
-                "social": round(random.uniform(500, 3000), 2),
-                "email": round(random.uniform(1500, 8000), 2)
-            }
-        },
-        "time_series": {
-            "dates": [(datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(30, 0, -1)],
-            "page_views": [random.randint(300, 1500) for _ in range(30)],
-            "conversions": [random.randint(10, 60) for _ in range(30)],
-            "revenue": [round(random.uniform(300, 1500), 2) for _ in range(30)]
-        }
-    }
+    # Serve the pre-serialized report while it is still fresh
+    key = (start_date, end_date)
+    now = time.monotonic()
+    cached = _report_cache.get(key)
+    if cached and now < cached["expires"]:
+        return current_app.response_class(cached["bytes"], mimetype="application/json")
     
-    return jsonify({
-        "report": report_data,
-        "timestamp": datetime.now().isoformat()
-    })
+    body = orjson.dumps({
+        "report": generate_report_data(start_date, end_date),
+        "timestamp": iso_now()
+    }, option=ORJSON_OPTIONS)
+    if len(_report_cache) >= REPORT_CACHE_MAX_ENTRIES:
+        _report_cache.clear()
+    _report_cache[key] = {"bytes": body, "expires": now + REPORT_CACHE_TTL}
+    return current_app.response_class(body, mimetype="application/json")
 
 # Orchestrator endpoints
-@app.route('/api/operator/orchestrator/cycles', methods=['GET'])
-def get_cycles():
-    return jsonify({
-        "cycles": data["cycles"],
-        "timestamp": datetime.now().isoformat()
-    })
-
-@app.route('/api/operator/orchestrator/cycles/<cycle_id>', methods=['GET'])
+@bp.route('/api/operator/orchestrator/cycles/<cycle_id>', methods=['GET'])
 def get_cycle_details(cycle_id):
-    cycle = next((c for c in data["cycles"] if c["id"] == cycle_id), None)
+    cycle = _cycles_by_id.get(cycle_id)
     if not cycle:
-        return jsonify({"status": "error", "message": "Cycle not found"}), 404
+        return fast_jsonify({"status": "error", "message": "Cycle not found"}), 404
     
     # Add more detailed information for the specific cycle
+    now = datetime.now()
     cycle_details = cycle.copy()
-    cycle_details["phases"] = [
-        "website_optimization",
-        "multi_channel_marketing",
-        "data_learning",
-        "content_refinement",
-        "revenue_optimization",
-        "system_expansion"
-    ]
-    cycle_details["current_phase_index"] = cycle_details["phases"].index(cycle["current_phase"])
+    cycle_details["phases"] = PHASES
+    cycle_details["current_phase_index"] = PHASE_INDEX[cycle["current_phase"]]
     cycle_details["tasks"] = [
         {
             "id": str(uuid.uuid4()),
             "name": "Analyze website performance",
             "status": "completed",
-            "completion_date": (datetime.now() - timedelta(days=1)).isoformat()
+            "completion_date": (now - timedelta(days=1)).isoformat()
         },
         {
             "id": str(uuid.uuid4()),
             "name": "Identify optimization opportunities",
             "status": "in_progress",
-            "start_date": (datetime.now() - timedelta(hours=12)).isoformat()
+            "start_date": (now - timedelta(hours=12)).isoformat()
         },
         {
             "id": str(uuid.uuid4()),
             "name": "Implement A/B testing",
             "status": "pending",
-            "due_date": (datetime.now() + timedelta(days=2)).isoformat()
+            "due_date": (now + timedelta(days=2)).isoformat()
         }
     ]
     
-    return jsonify({
+    return fast_jsonify({
         "cycle": cycle_details,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": iso_now()
     })
 
-@app.route('/api/operator/orchestrator/cycles/<cycle_id>/advance', methods=['POST'])
+@bp.route('/api/operator/orchestrator/cycles/<cycle_id>/advance', methods=['POST'])
 def advance_cycle_phase(cycle_id):
-    cycle = next((c for c in data["cycles"] if c["id"] == cycle_id), None)
+    cycle = _cycles_by_id.get(cycle_id)
     if not cycle:
-        return jsonify({"status": "error", "message": "Cycle not found"}), 404
-    
-    phases = [
-        "website_optimization",
-        "multi_channel_marketing",
-        "data_learning",
-        "content_refinement",
-        "revenue_optimization",
-        "system_expansion"
-    ]
+        return fast_jsonify({"status": "error", "message": "Cycle not found"}), 404
     
-    current_index = phases.index(cycle["current_phase"])
-    if current_index < len(phases) - 1:
-        cycle["current_phase"] = phases[current_index + 1]
+    with data_lock:
+        next_phase = NEXT_PHASE.get(cycle["current_phase"])
+        if next_phase is None:
+            return fast_jsonify({"status": "error", "message": "Already at the final phase"}), 400
+        
+        cycle["current_phase"] = next_phase
         cycle["last_phase_change"] = datetime.now().isoformat()
-        return jsonify({"status": "success", "message": f"Advanced to {cycle['current_phase']}"})
-    else:
-        return jsonify({"status": "error", "message": "Already at the final phase"}), 400
-
-@app.route('/api/operator/orchestrator/goals', methods=['GET'])
-def get_goals():
-    return jsonify({
-        "goals": data["goals"],
-        "timestamp": datetime.now().isoformat()
-    })
+        invalidate_list("cycles")
+    return fast_jsonify({"status": "success", "message": f"Advanced to {next_phase}"})
 
-@app.route('/api/operator/orchestrator/goals/<goal_id>', methods=['GET'])
+@bp.route('/api/operator/orchestrator/goals/<goal_id>', methods=['GET'])
 def get_goal_details(goal_id):
-    goal = next((g for g in data["goals"] if g["id"] == goal_id), None)
+    goal = _goals_by_id.get(goal_id)
     if not goal:
-        return jsonify({"status": "error", "message": "Goal not found"}), 404
+        return fast_jsonify({"status": "error", "message": "Goal not found"}), 404
     
     # Add more detailed information for the specific goal
+    now = datetime.now()
+    progress = goal["metrics"].get("progress", 0)
     goal_details = goal.copy()
-    goal_details["campaigns"] = [c for c in data["campaigns"] if c["goal_id"] == goal_id]
-    goal_details["created_at"] = (datetime.now() - timedelta(days=10)).isoformat()
-    goal_details["target_date"] = (datetime.now() + timedelta(days=20)).isoformat()
+    goal_details["campaigns"] = list(_campaigns_by_goal.get(goal_id, ()))
+    goal_details["created_at"] = (now - timedelta(days=10)).isoformat()
+    goal_details["target_date"] = (now + timedelta(days=20)).isoformat()
     goal_details["history"] = [
         {
-            "date": (datetime.now() - timedelta(days=8)).isoformat(),
-            "value": goal["metrics"].get("progress", 0) * 0.5
+            "date": (now - timedelta(days=8)).isoformat(),
+            "value": progress * 0.5
         },
         {
-            "date": (datetime.now() - timedelta(days=4)).isoformat(),
-            "value": goal["metrics"].get("progress", 0) * 0.8
+            "date": (now - timedelta(days=4)).isoformat(),
+            "value": progress * 0.8
         },
         {
-            "date": datetime.now().isoformat(),
-            "value": goal["metrics"].get("progress", 0)
+            "date": now.isoformat(),
+            "value": progress
         }
     ]
     
-    return jsonify({
+    return fast_jsonify({
         "goal": goal_details,
-        "timestamp": datetime.now().isoformat()
-    })
-
-@app.route('/api/operator/orchestrator/campaigns', methods=['GET'])
-def get_campaigns():
-    return jsonify({
-        "campaigns": data["campaigns"],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": iso_now()
     })
 
-@app.route('/api/operator/orchestrator/campaigns/<campaign_id>', methods=['GET'])
+@bp.route('/api/operator/orchestrator/campaigns/<campaign_id>', methods=['GET'])
 def get_campaign_details(campaign_id):
-    campaign = next((c for c in data["campaigns"] if c["id"] == campaign_id), None)
+    campaign = _campaigns_by_id.get(campaign_id)
     if not campaign:
-        return jsonify({"status": "error", "message": "Campaign not found"}), 404
+        return fast_jsonify({"status": "error", "message": "Campaign not found"}), 404
     
     # Add more detailed information for the specific campaign
+    now = datetime.now()
     campaign_details = campaign.copy()
-    campaign_details["created_at"] = (datetime.now() - timedelta(days=5)).isoformat()
-    campaign_details["start_date"] = (datetime.now() - timedelta(days=3)).isoformat()
-    campaign_details["end_date"] = (datetime.now() + timedelta(days=25)).isoformat()
+    campaign_details["created_at"] = (now - timedelta(days=5)).isoformat()
+    campaign_details["start_date"] = (now - timedelta(days=3)).isoformat()
+    campaign_details["end_date"] = (now + timedelta(days=25)).isoformat()
     campaign_details["channels"] = ["email", "social", "search"]
     campaign_details["budget"] = 5000.00
     campaign_details["spend"] = 2100.00
     campaign_details["history"] = [
         {
-            "date": (datetime.now() - timedelta(days=3)).isoformat(),
+            "date": (now - timedelta(days=3)).isoformat(),
             "metrics": {
                 "impressions": 15000,
                 "clicks": 1200,
@@ -450,7 +618,7 @@ def get_campaign_details(campaign_id):
             }
         },
         {
-            "date": (datetime.now() - timedelta(days=2)).isoformat(),
+            "date": (now - timedelta(days=2)).isoformat(),
             "metrics": {
                 "impressions": 30000,
                 "clicks": 2100,
@@ -459,50 +627,45 @@ def get_campaign_details(campaign_id):
             }
         },
         {
-            "date": datetime.now().isoformat(),
+            "date": now.isoformat(),
             "metrics": campaign["metrics"]
         }
     ]
     
-    return jsonify({
+    return fast_jsonify({
         "campaign": campaign_details,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": iso_now()
     })
 
-@app.route('/api/operator/orchestrator/campaigns/<campaign_id>/status', methods=['POST'])
+@bp.route('/api/operator/orchestrator/campaigns/<campaign_id>/status', methods=['POST'])
 def update_campaign_status(campaign_id):
-    campaign = next((c for c in data["campaigns"] if c["id"] == campaign_id), None)
+    campaign = _campaigns_by_id.get(campaign_id)
     if not campaign:
-        return jsonify({"status": "error", "message": "Campaign not found"}), 404
+        return fast_jsonify({"status": "error", "message": "Campaign not found"}), 404
     
     request_data = request.get_json()
     if not request_data or "status" not in request_data:
-        return jsonify({"status": "error", "message": "Status not provided"}), 400
+        return fast_jsonify({"status": "error", "message": "Status not provided"}), 400
     
     new_status = request_data["status"]
-    if new_status not in ["active", "paused", "completed", "cancelled"]:
-        return jsonify({"status": "error", "message": "Invalid status"}), 400
+    if new_status not in VALID_CAMPAIGN_STATUSES:
+        return fast_jsonify({"status": "error", "message": "Invalid status"}), 400
     
-    campaign["status"] = new_status
-    return jsonify({
+    with data_lock:
+        campaign["status"] = new_status
+        invalidate_list("campaigns")
+    return fast_jsonify({
         "status": "success",
         "message": f"Campaign status updated to {new_status}",
         "campaign": campaign
     })
 
 # Approvals endpoints
-@app.route('/api/operator/approvals', methods=['GET'])
-def get_approvals():
-    return jsonify({
-        "approvals": data["approvals"],
-        "timestamp": datetime.now().isoformat()
-    })
-
-@app.route('/api/operator/approvals/<approval_id>', methods=['GET'])
+@bp.route('/api/operator/approvals/<approval_id>', methods=['GET'])
 def get_approval_details(approval_id):
-    approval = next((a for a in data["approvals"] if a["id"] == approval_id), None)
+    approval = data["approvals"].get(approval_id)
     if not approval:
-        return jsonify({"status": "error", "message": "Approval not found"}), 404
+        return fast_jsonify({"status": "error", "message": "Approval not found"}), 404
     
     # Add more detailed information for the specific approval
     approval_details = approval.copy()
@@ -510,53 +673,156 @@ def get_approval_details(approval_id):
     approval_details["requested_by"] = "GAMS System"
     approval_details["urgency"] = "medium"
     
-    return jsonify({
+    return fast_jsonify({
         "approval": approval_details,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": iso_now()
     })
 
-@app.route('/api/operator/approvals/<approval_id>/action', methods=['POST'])
+@bp.route('/api/operator/approvals/<approval_id>/action', methods=['POST'])
 def process_approval(approval_id):
-    approval = next((a for a in data["approvals"] if a["id"] == approval_id), None)
+    approval = data["approvals"].get(approval_id)
     if not approval:
-        return jsonify({"status": "error", "message": "Approval not found"}), 404
+        return fast_jsonify({"status": "error", "message": "Approval not found"}), 404
     
     request_data = request.get_json()
     if not request_data or "action" not in request_data:
-        return jsonify({"status": "error", "message": "Action not provided"}), 400
+        return fast_jsonify({"status": "error", "message": "Action not provided"}), 400
     
     action = request_data["action"]
-    if action not in ["approve", "reject"]:
-        return jsonify({"status": "error", "message": "Invalid action"}), 400
+    new_status = APPROVAL_ACTION_STATUSES.get(action)
+    if new_status is None:
+        return fast_jsonify({"status": "error", "message": "Invalid action"}), 400
     
-    approval["status"] = "approved" if action == "approve" else "rejected"
+    with data_lock:
+        approval["status"] = new_status
+        
+        # Remove from pending approvals list
+        data["approvals"].pop(approval_id, None)
+        invalidate_list("approvals")
     
-    # Remove from pending approvals list
-    data["approvals"] = [a for a in data["approvals"] if a["id"] != approval_id]
-    
-    return jsonify({
+    return fast_jsonify({
         "status": "success",
         "message": f"Approval {action}d successfully"
     })
 
+# Collection list endpoints share one view shape: the cached, ETag-validated collection
+LIST_ENDPOINTS = (
+    ('/api/operator/analytics/recommendations', 'recommendations'),
+    ('/api/operator/orchestrator/cycles', 'cycles'),
+    ('/api/operator/orchestrator/goals', 'goals'),
+    ('/api/operator/orchestrator/campaigns', 'campaigns'),
+    ('/api/operator/approvals', 'approvals')
+)
+
+def make_list_view(key):
+    """Create the GET view returning the data[key] collection."""
+    def view():
+        return cached_list_response(key)
+    view.__name__ = f"get_{key}"
+    return view
+
+for rule, key in LIST_ENDPOINTS:
+    bp.add_url_rule(rule, view_func=make_list_view(key), methods=['GET'])
+
 # Helper functions
+def generate_report_data(start_date, end_date):
+    """Build a simulated performance report for the given period."""
+    # Draw every scalar in one batch and hand them out in field order
+    ints = iter(rng.integers(REPORT_INT_LOWS, REPORT_INT_HIGHS).tolist())
+    floats = iter((np.round(rng.uniform(REPORT_FLOAT_LOWS, REPORT_FLOAT_HIGHS) * REPORT_FLOAT_SCALES) / REPORT_FLOAT_SCALES).tolist())
+    
+    report_data = {
+        "summary": {
+            "period": f"{start_date} to {end_date}" if start_date and end_date else "Last 30 days",
+            "total_page_views": next(ints),
+            "total_conversions": next(ints),
+            "total_revenue": next(floats),
+            "avg_engagement_rate": next(floats)
+        },
+        "traffic": {
+            "total": next(ints),
+            "sources": {
+                "organic": next(floats),
+                "direct": next(floats),
+                "referral": next(floats),
+                "social": next(floats),
+                "email": next(floats),
+                "other": next(floats)
+            }
+        },
+        "conversions": {
+            "total": next(ints),
+            "rate": next(floats),
+            "by_source": {
+                "organic": next(floats),
+                "direct": next(floats),
+                "referral": next(floats),
+                "social": next(floats),
+                "email": next(floats)
+            }
+        },
+        "engagement": {
+            "avg_time_on_site": next(floats),
+            "pages_per_session": next(floats),
+            "bounce_rate": next(floats)
+        },
+        "revenue": {
+            "total": next(floats),
+            "average_order_value": next(floats),
+            "by_channel": {
+                "organic": next(floats),
+                "direct": next(floats),
+                "referral": next(floats),
+                "social": next(floats),
+                "email": next(floats)
+            }
+        },
+        "time_series": {
+            "dates": last_30_date_strs(),
+            "page_views": rng.integers(300, 1501, 30).tolist(),
+            "conversions": rng.integers(10, 61, 30).tolist(),
+            "revenue": np.round(rng.uniform(300, 1500, 30), 2).tolist()
+        }
+    }
+    return report_data
+
+def last_30_date_strs():
+    """Return the ISO dates of the 30 days before today, rebuilt once per day."""
+    today = date.today()
+    if _dates_cache["day"] != today:
+        _dates_cache["dates"] = [(today - timedelta(days=i)).isoformat() for i in range(30, 0, -1)]
+        _dates_cache["day"] = today
+    return _dates_cache["dates"]
+
 def calculate_uptime():
-    if not data["start_time"]:
+    start = data["_start_monotonic"]
+    if start is None:
         return 0
     
-    start_time = datetime.fromisoformat(data["start_time"])
-    now = datetime.now()
-    delta = now - start_time
-    return int(delta.total_seconds())
+    return int(time.monotonic() - start)
 
 # Serve static files
-@app.route('/', defaults={'path': 'enhanced_operator_dashboard.html'})
-@app.route('/<path:path>')
+@bp.route('/', defaults={'path': DASHBOARD_FILE})
+@bp.route('/<path:path>')
 def serve_static(path):
-    frontend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend')
-    return app.send_static_file(path)
+    return current_app.send_static_file(path)
+
+def create_app():
+    """Create the simulator app and generate a fresh simulated dataset."""
+    app = Flask(__name__, static_folder=FRONTEND_DIR)
+    app.json = OrjsonProvider(app)
+    app.register_blueprint(bp)
+    init_data()
+    
+    # Keep static file bytes out of the Python request path where possible
+    if os.environ.get("GAMS_API_X_SENDFILE") == "1":
+        # The fronting proxy streams the file named in the X-Sendfile header
+        app.use_x_sendfile = True
+    elif WHITENOISE_AVAILABLE:
+        app.wsgi_app = WhiteNoise(app.wsgi_app, root=FRONTEND_DIR, max_age=3600, index_file=DASHBOARD_FILE)
+    
+    return app
 
 if __name__ == '__main__':
-    # Set the static folder to the frontend directory
-    app.static_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend')
-    app.run(debug=True, port=5050)
+    # Debug mode is opt-in (FLASK_DEBUG=1); the reloader stays off either way
+    create_app().run(debug=os.environ.get("FLASK_DEBUG") == "1", port=5050, use_reloader=False, threaded=True)
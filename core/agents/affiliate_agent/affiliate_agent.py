@@ -7,17 +7,205 @@ focusing on product selection, revenue optimization, and continuous improvement.
 
 import logging
 import asyncio
-import json
-import random
+import copy
+import hashlib
+import math
+import sqlite3
 import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlencode
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+
+import numpy as np
+import orjson
 
 from core.agents.base_agent import BaseAgent
 
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 # Configure logging (configured centrally in main application)
 logger = logging.getLogger(__name__)
 
+# Stable serialization for cache keys (sorted keys, non-JSON values as str)
+ORJSON_KEY_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+# Result caches for repeated searches/analyses with identical parameters
+SEARCH_CACHE_TTL = 3600
+ANALYSIS_CACHE_TTL = 4 * 3600
+RESULT_CACHE_MAX_ENTRIES = 512
+RECOMMENDATION_CACHE_MAX_ENTRIES = 128
+
+# Compact per-day layout for simulated revenue series
+REVENUE_DTYPE = np.dtype([("sales", np.int64), ("revenue", np.float64)])
+REVENUE_YIELD_EVERY = 256
+
+# Tables of the optional SQLite store; each row keeps the full record as JSON
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id TEXT PRIMARY KEY,
+    platform TEXT,
+    category TEXT,
+    price REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS products_category_price ON products (category, price);
+CREATE INDEX IF NOT EXISTS products_platform ON products (platform);
+CREATE TABLE IF NOT EXISTS ab_tests (
+    id TEXT PRIMARY KEY,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS conversion_data (
+    product_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+# In-memory revenue history is bounded; full daily rows go to Redis when configured
+REVENUE_HISTORY_MAX_SERIES = 64
+REVENUE_REDIS_TTL = 90 * 24 * 3600
+REVENUE_REDIS_PREFIX = "affiliate:revenue"
+
+# Options for the simulated qualitative analysis fields
+LEVELS = ("low", "medium", "high")
+RECOMMENDATION_REASONS = ("High commission rate", "Good conversion rate", "Popular product")
+RECOMMENDATION_LEVELS = ("highly recommended", "recommended", "neutral", "not recommended")
+TREND_DIRECTIONS = ("increasing", "stable", "decreasing")
+SEASONAL_FACTORS = (None, "summer peak", "winter peak", "holiday season peak")
+FORECASTS = ("positive", "neutral", "negative")
+
+# Starting metrics for each A/B test variant (copied per variant)
+AB_EMPTY_VARIANT_METRICS = {
+    "impressions": 0,
+    "clicks": 0,
+    "conversions": 0,
+    "revenue": 0.0,
+    "ctr": 0.0,
+    "conversion_rate": 0.0
+}
+
+# Fixed A/B test analysis texts
+AB_WINNER_RECOMMENDATION = "Apply learnings from the winning variant to other marketing materials"
+AB_INCONCLUSIVE_INSIGHTS = (
+    "No statistically significant difference between variants",
+    "Consider running the test longer or with more traffic"
+)
+AB_INCONCLUSIVE_RECOMMENDATIONS = (
+    "Refine test variants to create more differentiation",
+    "Analyze user segments to see if certain audiences prefer different variants"
+)
+
+# Per-stage conversion bounds for the simulated funnel (clicks, carts, checkouts, purchases)
+FUNNEL_RATE_LOWS = np.array([0.02, 0.1, 0.3, 0.5])
+FUNNEL_RATE_HIGHS = np.array([0.1, 0.3, 0.6, 0.9])
+FUNNEL_STAGES = ("clicks", "add_to_carts", "checkouts", "purchases")
+
+# Recommendations for each funnel bottleneck stage
+BOTTLENECK_RECOMMENDATIONS = {
+    "clicks": (
+        "Improve ad copy and creative to increase click-through rate",
+        "Test different headlines and images to find what resonates with your audience",
+        "Refine targeting to reach more relevant potential customers"
+    ),
+    "add_to_carts": (
+        "Enhance product landing page to better showcase benefits",
+        "Add more compelling product images and descriptions",
+        "Include customer testimonials and social proof"
+    ),
+    "checkouts": (
+        "Simplify the checkout process to reduce abandonment",
+        "Add trust signals and security badges",
+        "Implement exit-intent popups with special offers"
+    ),
+    "purchases": (
+        "Review pricing strategy and consider limited-time offers",
+        "Add guarantees to reduce purchase anxiety",
+        "Implement abandoned cart email sequences"
+    )
+}
+
+@dataclass(frozen=True)
+class ProductStats:
+    """Numeric product fields and the metrics derived from them"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "price", "commission_rate", "conversion_rate", "popularity",
+        "commission_per_sale", "potential_revenue", "strengths", "weaknesses"
+    )
+    
+    price: float
+    commission_rate: float
+    conversion_rate: float
+    popularity: float
+    commission_per_sale: float
+    potential_revenue: float
+    strengths: Tuple[str, ...]
+    weaknesses: Tuple[str, ...]
+    
+    @classmethod
+    def from_product(cls, product: Dict[str, Any]) -> "ProductStats":
+        """Build stats from a product dict."""
+        price = product.get("price", 0)
+        commission_rate = product.get("commission_rate", 0)
+        conversion_rate = product.get("conversion_rate", 0)
+        popularity = product.get("popularity", 0)
+        commission_per_sale = price * (commission_rate / 100)
+        
+        return cls(
+            price=price,
+            commission_rate=commission_rate,
+            conversion_rate=conversion_rate,
+            popularity=popularity,
+            commission_per_sale=commission_per_sale,
+            potential_revenue=commission_per_sale * conversion_rate,
+            strengths=tuple(label for label, applies in (
+                ("High commission rate", commission_rate > 30),
+                ("Good conversion rate", conversion_rate > 3),
+                ("Popular product", popularity > 7)
+            ) if applies),
+            weaknesses=tuple(label for label, applies in (
+                ("Low commission rate", commission_rate < 15),
+                ("Poor conversion rate", conversion_rate < 2),
+                ("Low popularity", popularity < 3)
+            ) if applies)
+        )
+
+def two_proportion_z_test(successes_a: int, trials_a: int,
+                          successes_b: int, trials_b: int) -> Tuple[float, float]:
+    """
+    Compare two conversion rates with a pooled two-proportion z-test.
+    
+    Args:
+        successes_a: Conversions in group A
+        trials_a: Trials (e.g. clicks) in group A
+        successes_b: Conversions in group B
+        trials_b: Trials in group B
+        
+    Returns:
+        Tuple of (z score of A over B, two-sided p-value)
+    """
+    if trials_a <= 0 or trials_b <= 0:
+        return 0.0, 1.0
+        
+    pooled = (successes_a + successes_b) / (trials_a + trials_b)
+    se = math.sqrt(pooled * (1 - pooled) * (1 / trials_a + 1 / trials_b))
+    if se == 0:
+        return 0.0, 1.0
+        
+    z = (successes_a / trials_a - successes_b / trials_b) / se
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes with orjson."""
+    return orjson.dumps(obj, default=str, option=ORJSON_KEY_OPTIONS)
+
 class AffiliateAgent(BaseAgent):
     """
     Specialized agent for affiliate marketing.
@@ -42,14 +230,117 @@ class AffiliateAgent(BaseAgent):
         # Initialize affiliate platforms
         self.platforms = {}
         self.products = {}
-        self.revenue_data = {}
+        self._by_platform = defaultdict(list)
+        self._stats = {}
+        self.revenue_data = OrderedDict()
         self.conversion_data = {}
+        self.ab_tests = {}
+        
+        # Shared generator for simulated data
+        self._rng = np.random.default_rng()
+        
+        # Bumped on every product change; views and caches built from an older version are stale
+        self._products_version = 0
         
+        # Bumped when a stored product is replaced; analyses of older revisions are stale
+        self._product_revisions = {}
+        
+        # Columnar view of the products for vectorized filtering/scoring
+        self._p_version = -1
+        
+        # Recommendation lists keyed by (niche, budget, platform, count, products version)
+        self._recommendation_cache = OrderedDict()
+        
+        # Cached results keyed by (parameter hash, version): key -> (stored_at, result)
+        self._search_cache = OrderedDict()
+        self._analysis_cache = OrderedDict()
+        
+        # Simulated competition/trend sections: (product_id, section) -> (stored_at, data)
+        self._section_cache = {}
+        
+        # Optional time-series store for daily revenue rows
+        redis_url = (config or {}).get("redis_url")
+        self._redis = None
+        if redis_url:
+            if REDIS_AVAILABLE:
+                self._redis = aioredis.Redis.from_url(redis_url, decode_responses=True)
+            else:
+                logger.warning("redis_url configured but redis is not installed; revenue stays in memory")
+                
+        # Optional SQLite store; the dicts above act as a write-through cache over it
+        self._db = None
+        db_path = (config or {}).get("db_path")
+        if db_path:
+            db = self._open_store(db_path)
+            self._load_store(db)
+            self._db = db
+            
         # Register actions
         self._register_actions()
         
         logger.info("Affiliate Marketing Agent initialized")
         
+    @staticmethod
+    def _open_store(db_path: str) -> sqlite3.Connection:
+        """
+        Open the SQLite store in WAL mode and create its tables.
+        
+        Args:
+            db_path: Path of the database file
+            
+        Returns:
+            Autocommit connection usable from any thread
+        """
+        db = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(STORE_SCHEMA)
+        return db
+        
+    def _load_store(self, db: sqlite3.Connection) -> None:
+        """
+        Load persisted products, A/B tests and conversion data into memory.
+        
+        Args:
+            db: Open store connection
+        """
+        for (data,) in db.execute("SELECT data FROM products"):
+            self._add_product(orjson.loads(data))
+        for test_id, data in db.execute("SELECT id, data FROM ab_tests"):
+            self.ab_tests[test_id] = orjson.loads(data)
+        for product_id, data in db.execute("SELECT product_id, data FROM conversion_data"):
+            self.conversion_data[product_id] = orjson.loads(data)
+            
+        logger.info(f"Loaded {len(self.products)} products and {len(self.ab_tests)} A/B tests from store")
+        
+    def _store_product(self, product: Dict[str, Any]) -> None:
+        """Write a product through to the store, if configured."""
+        if self._db is not None:
+            self._db.execute(
+                "INSERT INTO products (id, platform, category, price, data) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET platform = excluded.platform, category = excluded.category, "
+                "price = excluded.price, data = excluded.data",
+                (product["id"], product["platform"], product.get("category"), product.get("price"), orjson.dumps(product, default=str).decode())
+            )
+            
+    def _store_ab_test(self, test: Dict[str, Any]) -> None:
+        """Write an A/B test through to the store, if configured."""
+        if self._db is not None:
+            self._db.execute(
+                "INSERT INTO ab_tests (id, status, data) VALUES (?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET status = excluded.status, data = excluded.data",
+                (test["id"], test["status"], orjson.dumps(test, default=str).decode())
+            )
+            
+    def _store_conversion_data(self, product_id: str, record: Dict[str, Any]) -> None:
+        """Write a product's conversion data through to the store, if configured."""
+        if self._db is not None:
+            self._db.execute(
+                "INSERT INTO conversion_data (product_id, data) VALUES (?, ?) "
+                "ON CONFLICT(product_id) DO UPDATE SET data = excluded.data",
+                (product_id, orjson.dumps(record, default=str).decode())
+            )
+            
     def _register_actions(self) -> None:
         """Register agent-specific actions."""
         self.register_action("search_products", self.search_products)
@@ -60,6 +351,7 @@ class AffiliateAgent(BaseAgent):
         self.register_action("analyze_conversion_funnel", self.analyze_conversion_funnel)
         self.register_action("generate_product_recommendations", self.generate_product_recommendations)
         self.register_action("create_ab_test", self.create_ab_test)
+        self.register_action("update_ab_test_metrics_bulk", self.update_ab_test_metrics_bulk)
         self.register_action("analyze_ab_test_results", self.analyze_ab_test_results)
         
     async def connect_platform(self, platform_name: str, credentials: Dict[str, Any]) -> Dict[str, Any]:
@@ -116,17 +408,189 @@ class AffiliateAgent(BaseAgent):
         Args:
             params: Search parameters
                 - platform: Platform to search (e.g., 'clickbank', 'amazon')
+                - platforms: Several platforms to search concurrently (overrides 'platform')
                 - category: Product category
                 - keywords: Keywords to search for
                 - min_commission: Minimum commission rate
                 - max_price: Maximum product price
                 - sort_by: Sort criteria (e.g., 'popularity', 'commission')
                 
+        Returns:
+            Dict containing search results ('cache' is 'HIT' or 'MISS')
+        """
+        return await self._cached_call(self._search_cache, SEARCH_CACHE_TTL, self._search_products, params)
+        
+    async def _search_products(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Search for affiliate products without consulting the result cache.
+        
+        Args:
+            params: Search parameters (see search_products)
+            
+        Returns:
+            Dict containing search results
+        """
+        platforms = (params or {}).get("platforms")
+        if not platforms:
+            return await self._search_platform(params)
+            
+        # Fan out one search per platform and wait for them together
+        base_params = {key: value for key, value in params.items() if key != "platforms"}
+        results = await asyncio.gather(
+            *(self._search_platform({**base_params, "platform": platform}) for platform in platforms),
+            return_exceptions=True
+        )
+        
+        products = []
+        errors = {}
+        for platform, result in zip(platforms, results):
+            if isinstance(result, Exception):
+                errors[platform] = str(result)
+            elif result.get("status") != "success":
+                errors[platform] = result.get("message", "Search failed")
+            else:
+                products.extend(result.get("products", []))
+                
+        return {
+            "status": "success" if len(errors) < len(platforms) else "error",
+            "products": products,
+            "errors": errors
+        }
+        
+    async def _search_platform(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Search a single platform for affiliate products.
+        
+        Args:
+            params: Search parameters (see search_products)
+            
         Returns:
             Dict containing search results
         """
         # Proxy to SEMrush MCP service
-        return await self.call_mcp("mcp.semrush", "search_products", params)
+        result = await self.call_mcp("mcp.semrush", "search_products", params)
+        
+        # Keep returned products so they can be analyzed and tracked later
+        for product in result.get("products", []):
+            if "id" not in product or "platform" not in product:
+                logger.warning(f"Skipping search result without id or platform: {product}")
+                continue
+            self._add_product(product)
+            
+        return result
+        
+    def _add_product(self, product: Dict[str, Any]) -> None:
+        """
+        Store a product and keep the per-platform index and stats in sync.
+        
+        Args:
+            product: Product data (must include 'id' and 'platform')
+        """
+        previous = self.products.get(product["id"])
+        if previous is not None:
+            self._by_platform[previous["platform"]].remove(previous)
+            # Cached analyses of the replaced product no longer match its key
+            self._product_revisions[product["id"]] = self._product_revisions.get(product["id"], 0) + 1
+            self._section_cache.pop((product["id"], "comp"), None)
+            self._section_cache.pop((product["id"], "trends"), None)
+            
+        self._stats[product["id"]] = ProductStats.from_product(product)
+        self.products[product["id"]] = product
+        self._products_version += 1
+        self._store_product(product)
+        self._by_platform[product["platform"]].append(product)
+        
+    def _rebuild_product_arrays(self) -> None:
+        """
+        Rebuild the columnar product arrays if products changed.
+        
+        Rows follow self.products order. Category and platform are stored as
+        int32 codes into self._p_cat_index / self._p_plat_index.
+        """
+        if self._p_version == self._products_version:
+            return
+            
+        products = list(self.products.values())
+        stats = [self._stats[p["id"]] for p in products]
+        
+        self._p_cat_index = {}
+        self._p_plat_index = {}
+        self._p_ids = np.array([p["id"] for p in products], dtype=object)
+        self._p_prices = np.array([st.price for st in stats], dtype=np.float64)
+        self._p_comm = np.array([st.commission_rate for st in stats], dtype=np.float64)
+        self._p_conv = np.array([st.conversion_rate for st in stats], dtype=np.float64)
+        self._p_cat_codes = np.array(
+            [self._p_cat_index.setdefault(p.get("category"), len(self._p_cat_index)) for p in products], dtype=np.int32
+        )
+        self._p_plat_codes = np.array(
+            [self._p_plat_index.setdefault(p["platform"], len(self._p_plat_index)) for p in products], dtype=np.int32
+        )
+        
+        # Recommendation score: 60% potential revenue, 40% popularity
+        potential = np.array([st.potential_revenue for st in stats], dtype=np.float64)
+        popularity = np.array([st.popularity for st in stats], dtype=np.float64)
+        self._p_scores = potential * 0.6 + popularity * 0.4
+        
+        self._p_version = self._products_version
+        
+    def _cached_section(self, product_id: str, section: str, build) -> Dict[str, Any]:
+        """
+        Return a simulated analysis section, rebuilding it once it expires.
+        
+        Args:
+            product_id: ID of the analyzed product
+            section: Section name ('comp' or 'trends')
+            build: Callable producing the section data
+            
+        Returns:
+            Section data
+        """
+        key = (product_id, section)
+        entry = self._section_cache.get(key)
+        if entry is not None and time.time() - entry[0] < ANALYSIS_CACHE_TTL:
+            return entry[1]
+            
+        data = build()
+        self._section_cache[key] = (time.time(), data)
+        return data
+        
+    async def _cached_call(self, cache: OrderedDict, ttl: float, func, params: Dict[str, Any] = None,
+                           version: Any = None) -> Dict[str, Any]:
+        """
+        Serve a successful result from cache or compute and store it.
+        
+        Results reporting partial failures in 'errors' are not cached, and
+        cached results are copied in both directions so callers cannot
+        modify them.
+        
+        Args:
+            cache: Cache to consult (bounded LRU of (stored_at, result))
+            ttl: Maximum age of a cached result in seconds
+            func: Coroutine function computing the result from params
+            params: Parameters for func; their hash is the cache key
+            version: Version of the data func reads; results of other versions are not reused
+            
+        Returns:
+            Result dict with 'cache' set to 'HIT' or 'MISS'
+        """
+        key = (hashlib.sha256(_dumps(params)).hexdigest(), version)
+        
+        entry = cache.get(key)
+        if entry is not None:
+            stored_at, result = entry
+            if time.time() - stored_at < ttl:
+                cache.move_to_end(key)
+                return {**copy.deepcopy(result), "cache": "HIT"}
+            del cache[key]
+            
+        result = await func(params)
+        
+        if result.get("status") == "success" and not result.get("errors"):
+            cache[key] = (time.time(), copy.deepcopy(result))
+            if len(cache) > RESULT_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+                
+        return {**result, "cache": "MISS"}
         
     async def analyze_product(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -138,6 +602,19 @@ class AffiliateAgent(BaseAgent):
                 - include_competition: Whether to include competition analysis
                 - include_trends: Whether to include trend analysis
                 
+        Returns:
+            Dict containing product analysis ('cache' is 'HIT' or 'MISS')
+        """
+        revision = self._product_revisions.get((params or {}).get("product_id"), 0)
+        return await self._cached_call(self._analysis_cache, ANALYSIS_CACHE_TTL, self._analyze_product, params, revision)
+        
+    async def _analyze_product(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Analyze an affiliate product without consulting the result cache.
+        
+        Args:
+            params: Analysis parameters (see analyze_product)
+            
         Returns:
             Dict containing product analysis
         """
@@ -162,59 +639,78 @@ class AffiliateAgent(BaseAgent):
             }
             
         product = self.products[product_id]
+        stats = self._stats[product_id]
         
-        # Basic analysis
+        # Basic analysis (derived metrics are precomputed in ProductStats)
         analysis = {
             "product": product,
-            "potential_revenue": product["price"] * (product["commission_rate"] / 100) * product["conversion_rate"],
-            "competition_level": random.choice(["low", "medium", "high"]),
-            "recommendation": random.choice(["highly recommended", "recommended", "neutral", "not recommended"]),
-            "strengths": [
-                "High commission rate" if product["commission_rate"] > 30 else None,
-                "Good conversion rate" if product["conversion_rate"] > 3 else None,
-                "Popular product" if product["popularity"] > 7 else None
-            ],
-            "weaknesses": [
-                "Low commission rate" if product["commission_rate"] < 15 else None,
-                "Poor conversion rate" if product["conversion_rate"] < 2 else None,
-                "Low popularity" if product["popularity"] < 3 else None
-            ]
+            "potential_revenue": stats.potential_revenue,
+            "competition_level": self._pick(LEVELS),
+            "recommendation": self._pick(RECOMMENDATION_LEVELS),
+            "strengths": list(stats.strengths),
+            "weaknesses": list(stats.weaknesses)
         }
         
-        # Filter out None values
-        analysis["strengths"] = [s for s in analysis["strengths"] if s]
-        analysis["weaknesses"] = [w for w in analysis["weaknesses"] if w]
-        
         # Add competition analysis if requested
         if params.get("include_competition"):
-            analysis["competition"] = {
-                "similar_products": [
-                    {
-                        "id": f"{product['platform']}_{product['category']}_{random.randint(100, 999)}",
-                        "name": f"Competitor {product['category'].title()} Product {i}",
-                        "price": product["price"] * random.uniform(0.8, 1.2),
-                        "commission_rate": product["commission_rate"] * random.uniform(0.8, 1.2),
-                        "popularity": product["popularity"] * random.uniform(0.8, 1.2)
-                    }
-                    for i in range(3)
-                ],
-                "market_saturation": random.choice(["low", "medium", "high"]),
-                "competitive_advantage": "Higher commission rate" if product["commission_rate"] > 25 else "Lower price point"
-            }
+            analysis["competition"] = self._cached_section(product_id, "comp", lambda: self._simulate_competition(product))
             
         # Add trend analysis if requested
         if params.get("include_trends"):
-            analysis["trends"] = {
-                "popularity_trend": random.choice(["increasing", "stable", "decreasing"]),
-                "seasonal_factors": random.choice([None, "summer peak", "winter peak", "holiday season peak"]),
-                "forecast": random.choice(["positive", "neutral", "negative"])
-            }
+            analysis["trends"] = self._cached_section(product_id, "trends", lambda: {
+                "popularity_trend": self._pick(TREND_DIRECTIONS),
+                "seasonal_factors": self._pick(SEASONAL_FACTORS),
+                "forecast": self._pick(FORECASTS)
+            })
             
         return {
             "status": "success",
             "analysis": analysis
         }
         
+    def _pick(self, options: Tuple[Any, ...]) -> Any:
+        """
+        Pick one option uniformly with the shared generator.
+        
+        Args:
+            options: Options to choose from
+            
+        Returns:
+            The chosen option (as the original Python object)
+        """
+        return options[self._rng.integers(len(options))]
+        
+    def _simulate_competition(self, product: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Simulate a competition analysis for a product.
+        
+        Args:
+            product: Product being analyzed
+            
+        Returns:
+            Dict containing similar products and market saturation
+        """
+        stats = self._stats[product["id"]]
+        category = product.get("category", "")
+        suffixes = self._rng.integers(100, 1000, size=3)
+        # Rows are competitors; columns scale price, commission rate and popularity
+        factors = self._rng.uniform(0.8, 1.2, size=(3, 3))
+        
+        return {
+            "similar_products": [
+                {
+                    "id": f"{product['platform']}_{category}_{suffixes[i]}",
+                    "name": f"Competitor {category.title()} Product {i}",
+                    "price": stats.price * float(factors[i, 0]),
+                    "commission_rate": stats.commission_rate * float(factors[i, 1]),
+                    "popularity": stats.popularity * float(factors[i, 2])
+                }
+                for i in range(3)
+            ],
+            "market_saturation": self._pick(LEVELS),
+            "competitive_advantage": "Higher commission rate" if stats.commission_rate > 25 else "Lower price point"
+        }
+        
     async def track_revenue(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Track revenue from affiliate products.
@@ -225,6 +721,7 @@ class AffiliateAgent(BaseAgent):
                 - platform: Platform to track (optional)
                 - start_date: Start date for tracking period
                 - end_date: End date for tracking period
+                - include_data: Whether to include the daily records (default: True)
                 
         Returns:
             Dict containing revenue data
@@ -235,147 +732,341 @@ class AffiliateAgent(BaseAgent):
                 "message": "No parameters provided"
             }
             
+        try:
+            series = self._simulate_revenue(params)
+        except ValueError as e:
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+            
+        # Store the compact series rather than the expanded daily records
+        self.revenue_data[datetime.now().isoformat()] = series
+        if len(self.revenue_data) > REVENUE_HISTORY_MAX_SERIES:
+            self.revenue_data.popitem(last=False)
+            
+        if self._redis is not None:
+            await self._persist_revenue(series)
+        
+        # Calculate summary metrics
+        totals = series["totals"]
+        total_revenue = float(totals["revenue"].sum())
+        total_sales = int(totals["sales"].sum())
+        
+        daily_avg_revenue = total_revenue / len(totals) if len(totals) else 0
+        
+        result = {
+            "status": "success",
+            "start_date": series["start_date"],
+            "end_date": series["end_date"],
+            "total_revenue": total_revenue,
+            "total_sales": total_sales,
+            "daily_average_revenue": daily_avg_revenue
+        }
+        
+        if params.get("include_data", True):
+            result["data"] = [self._revenue_record(series, day) for day in range(len(totals))]
+            
+        return result
+        
+    async def iter_revenue(self, params: Dict[str, Any] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield daily revenue records one at a time.
+        
+        Args:
+            params: Tracking parameters (see track_revenue)
+            
+        Yields:
+            Daily revenue record, in the same shape as track_revenue's 'data' entries
+            
+        Raises:
+            ValueError: If the parameters are invalid
+        """
+        series = self._simulate_revenue(params or {})
+        
+        for day in range(len(series["totals"])):
+            yield self._revenue_record(series, day)
+            
+            # Let other tasks run during long date ranges
+            if day % REVENUE_YIELD_EVERY == REVENUE_YIELD_EVERY - 1:
+                await asyncio.sleep(0)
+                
+    def _simulate_revenue(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Simulate revenue for a tracking period as compact per-day arrays.
+        
+        Args:
+            params: Tracking parameters (see track_revenue)
+            
+        Returns:
+            Dict describing the period, with 'totals' (and 'platforms' when
+            tracking all platforms) as REVENUE_DTYPE arrays with one row per day
+            
+        Raises:
+            ValueError: If the dates, product or platform are invalid
+        """
         product_id = params.get("product_id")
         platform = params.get("platform")
-        start_date = params.get("start_date", (datetime.now() - timedelta(days=30)).isoformat())
-        end_date = params.get("end_date", datetime.now().isoformat())
+        now = datetime.now()
+        start_date = params.get("start_date") or (now - timedelta(days=30)).isoformat()
+        end_date = params.get("end_date") or now.isoformat()
         
         # Convert dates to datetime objects
         try:
             start_dt = datetime.fromisoformat(start_date)
             end_dt = datetime.fromisoformat(end_date)
         except ValueError:
-            return {
-                "status": "error",
-                "message": "Invalid date format"
-            }
+            raise ValueError("Invalid date format")
             
-        # Generate simulated revenue data
-        revenue_data = []
+        # Days in the tracking period, inclusive of both ends
+        n_days = max((end_dt - start_dt) // timedelta(days=1) + 1, 0)
+        
+        series = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "start_dt": start_dt,
+            "dates": [(start_dt + timedelta(days=day)).isoformat() for day in range(n_days)],
+            "product_id": product_id,
+            "platform": platform,
+            "platforms": None
+        }
         
         # If product_id is specified, track for that product only
         if product_id:
             if product_id not in self.products:
-                return {
-                    "status": "error",
-                    "message": f"Product not found: {product_id}"
-                }
+                raise ValueError(f"Product not found: {product_id}")
                 
             product = self.products[product_id]
+            series["platform"] = product["platform"]
+            series["totals"] = self._revenue_rows(*self._simulate_daily_sales([product], n_days, 10))
             
-            # Generate daily revenue data
-            current_date = start_dt
-            while current_date <= end_dt:
-                daily_sales = random.randint(0, 10)
-                daily_revenue = daily_sales * product["price"] * (product["commission_rate"] / 100)
-                
-                revenue_data.append({
-                    "date": current_date.isoformat(),
-                    "product_id": product_id,
-                    "platform": product["platform"],
-                    "sales": daily_sales,
-                    "revenue": daily_revenue
-                })
-                
-                current_date += timedelta(days=1)
-                
         # If platform is specified, track for that platform only
         elif platform:
             if platform not in self.platforms:
-                return {
-                    "status": "error",
-                    "message": f"Not connected to platform: {platform}"
-                }
-                
-            # Get all products for the platform
-            platform_products = [p for p in self.products.values() if p["platform"] == platform]
-            
-            # Generate daily revenue data
-            current_date = start_dt
-            while current_date <= end_dt:
-                daily_platform_revenue = 0
-                daily_platform_sales = 0
-                
-                for product in platform_products:
-                    daily_sales = random.randint(0, 5)
-                    daily_revenue = daily_sales * product["price"] * (product["commission_rate"] / 100)
-                    
-                    daily_platform_sales += daily_sales
-                    daily_platform_revenue += daily_revenue
-                
-                revenue_data.append({
-                    "date": current_date.isoformat(),
-                    "platform": platform,
-                    "sales": daily_platform_sales,
-                    "revenue": daily_platform_revenue
-                })
-                
-                current_date += timedelta(days=1)
+                raise ValueError(f"Not connected to platform: {platform}")
                 
+            platform_products = self._by_platform.get(platform, [])
+            series["totals"] = self._revenue_rows(*self._simulate_daily_sales(platform_products, n_days, 5))
+            
         # Otherwise, track for all platforms
         else:
-            # Generate daily revenue data
-            current_date = start_dt
-            while current_date <= end_dt:
-                daily_total_revenue = 0
-                daily_total_sales = 0
-                platform_data = {}
-                
-                for platform_name in self.platforms:
-                    platform_products = [p for p in self.products.values() if p["platform"] == platform_name]
-                    
-                    daily_platform_revenue = 0
-                    daily_platform_sales = 0
-                    
-                    for product in platform_products:
-                        daily_sales = random.randint(0, 3)
-                        daily_revenue = daily_sales * product["price"] * (product["commission_rate"] / 100)
-                        
-                        daily_platform_sales += daily_sales
-                        daily_platform_revenue += daily_revenue
-                    
-                    platform_data[platform_name] = {
-                        "sales": daily_platform_sales,
-                        "revenue": daily_platform_revenue
-                    }
-                    
-                    daily_total_sales += daily_platform_sales
-                    daily_total_revenue += daily_platform_revenue
-                
-                revenue_data.append({
-                    "date": current_date.isoformat(),
-                    "total_sales": daily_total_sales,
-                    "total_revenue": daily_total_revenue,
-                    "platforms": platform_data
-                })
-                
-                current_date += timedelta(days=1)
-                
-        # Store revenue data
-        self.revenue_data[datetime.now().isoformat()] = {
-            "start_date": start_date,
-            "end_date": end_date,
-            "product_id": product_id,
-            "platform": platform,
-            "data": revenue_data
-        }
+            # Generate daily revenue data per platform, then total across platforms
+            platform_names = list(self.platforms)
+            platform_sales, platform_revenue = self._simulate_platform_sales(platform_names, n_days, 3)
+            
+            series["totals"] = self._revenue_rows(platform_sales.sum(axis=1), platform_revenue.sum(axis=1))
+            series["platforms"] = {
+                platform_name: self._revenue_rows(platform_sales[:, col], platform_revenue[:, col])
+                for col, platform_name in enumerate(platform_names)
+            }
+            
+        return series
+        
+    @staticmethod
+    def _revenue_scope(series: Dict[str, Any]) -> str:
+        """Redis key scope for a revenue series: product, platform or 'all'."""
+        if series["product_id"]:
+            return f"product:{series['product_id']}"
+        if series["platforms"] is None:
+            return f"platform:{series['platform']}"
+        return "all"
+        
+    async def _persist_revenue(self, series: Dict[str, Any]) -> None:
+        """
+        Write a revenue series to Redis as one hash per day.
         
-        # Calculate summary metrics
-        total_revenue = sum(day["revenue"] if "revenue" in day else day["total_revenue"] for day in revenue_data)
-        total_sales = sum(day["sales"] if "sales" in day else day["total_sales"] for day in revenue_data)
+        Each day is stored at '<prefix>:<scope>:<date>' and indexed in the
+        '<prefix>:<scope>' sorted set, scored by the date's ordinal.
         
-        daily_avg_revenue = total_revenue / len(revenue_data) if revenue_data else 0
+        Args:
+            series: Series returned by _simulate_revenue
+        """
+        scope = self._revenue_scope(series)
+        index_key = f"{REVENUE_REDIS_PREFIX}:{scope}"
+        first_day = series["start_dt"].date()
+        
+        pipe = self._redis.pipeline(transaction=False)
+        for day, (sales, revenue) in enumerate(series["totals"].tolist()):
+            date = first_day + timedelta(days=day)
+            day_key = f"{index_key}:{date.isoformat()}"
+            pipe.hset(day_key, mapping={"sales": sales, "revenue": revenue})
+            pipe.expire(day_key, REVENUE_REDIS_TTL)
+            pipe.zadd(index_key, {date.isoformat(): date.toordinal()})
+        pipe.expire(index_key, REVENUE_REDIS_TTL)
+        
+        try:
+            await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to persist revenue for {scope}: {str(e)}")
+            
+    async def load_revenue_summary(self, scope: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        """
+        Summarize stored daily revenue for a scope and date range.
+        
+        Args:
+            scope: 'product:<id>', 'platform:<name>' or 'all'
+            start_date: Start of the range (ISO format)
+            end_date: End of the range (ISO format, inclusive)
+            
+        Returns:
+            Dict containing totals for the stored days in the range
+        """
+        if self._redis is None:
+            return {
+                "status": "error",
+                "message": "No revenue store configured"
+            }
+            
+        try:
+            start = datetime.fromisoformat(start_date).date().toordinal()
+            end = datetime.fromisoformat(end_date).date().toordinal()
+        except ValueError:
+            return {
+                "status": "error",
+                "message": "Invalid date format"
+            }
+            
+        index_key = f"{REVENUE_REDIS_PREFIX}:{scope}"
+        
+        try:
+            dates = await self._redis.zrangebyscore(index_key, start, end)
+            pipe = self._redis.pipeline(transaction=False)
+            for date in dates:
+                pipe.hmget(f"{index_key}:{date}", "sales", "revenue")
+            rows = await pipe.execute()
+        except RedisError as e:
+            return {
+                "status": "error",
+                "message": f"Failed to load revenue: {str(e)}"
+            }
+            
+        # Days whose hash expired before the index are skipped
+        rows = [row for row in rows if row[0] is not None]
+        total_sales = sum(int(sales) for sales, _ in rows)
+        total_revenue = sum(float(revenue) for _, revenue in rows)
         
         return {
             "status": "success",
+            "scope": scope,
             "start_date": start_date,
             "end_date": end_date,
-            "total_revenue": total_revenue,
+            "days": len(rows),
             "total_sales": total_sales,
-            "daily_average_revenue": daily_avg_revenue,
-            "data": revenue_data
+            "total_revenue": total_revenue
         }
         
+    @staticmethod
+    def _revenue_rows(daily_sales: np.ndarray, daily_revenue: np.ndarray) -> np.ndarray:
+        """
+        Pack daily sales and revenue into a REVENUE_DTYPE array.
+        
+        Args:
+            daily_sales: Sales per day
+            daily_revenue: Revenue per day
+            
+        Returns:
+            Structured array with one row per day
+        """
+        rows = np.empty(len(daily_sales), dtype=REVENUE_DTYPE)
+        rows["sales"] = daily_sales
+        rows["revenue"] = daily_revenue
+        return rows
+        
+    @staticmethod
+    def _revenue_record(series: Dict[str, Any], day: int) -> Dict[str, Any]:
+        """
+        Expand one day of a simulated revenue series into a record.
+        
+        Args:
+            series: Series returned by _simulate_revenue
+            day: Day offset from the start of the period
+            
+        Returns:
+            Daily revenue record
+        """
+        date = series["dates"][day]
+        sales, revenue = series["totals"][day].item()
+        
+        if series["product_id"]:
+            return {
+                "date": date,
+                "product_id": series["product_id"],
+                "platform": series["platform"],
+                "sales": sales,
+                "revenue": revenue
+            }
+            
+        if series["platforms"] is None:
+            return {
+                "date": date,
+                "platform": series["platform"],
+                "sales": sales,
+                "revenue": revenue
+            }
+            
+        platforms = {}
+        for platform_name, rows in series["platforms"].items():
+            platform_sales, platform_revenue = rows[day].item()
+            platforms[platform_name] = {
+                "sales": platform_sales,
+                "revenue": platform_revenue
+            }
+            
+        return {
+            "date": date,
+            "total_sales": sales,
+            "total_revenue": revenue,
+            "platforms": platforms
+        }
+        
+    def _simulate_daily_sales(self, products: List[Dict[str, Any]], n_days: int,
+                              max_daily_sales: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate daily sales for a group of products.
+        
+        Args:
+            products: Products to simulate
+            n_days: Number of days to simulate
+            max_daily_sales: Maximum sales per product per day
+            
+        Returns:
+            Tuple of (total sales per day, total commission revenue per day)
+        """
+        commission_per_sale = np.array(
+            [self._stats[p["id"]].commission_per_sale for p in products], dtype=np.float64
+        )
+        sales = self._rng.integers(0, max_daily_sales + 1, size=(n_days, len(products)))
+        return sales.sum(axis=1), sales @ commission_per_sale
+        
+    def _simulate_platform_sales(self, platform_names: List[str], n_days: int,
+                                 max_daily_sales: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate daily sales for every product of several platforms in one draw.
+        
+        Args:
+            platform_names: Platforms to simulate
+            n_days: Number of days to simulate
+            max_daily_sales: Maximum sales per product per day
+            
+        Returns:
+            Tuple of (sales, commission revenue), each of shape (n_days, len(platform_names))
+        """
+        platform_products = [self._by_platform.get(name, []) for name in platform_names]
+        products = [product for group in platform_products for product in group]
+        
+        # One-hot product -> platform membership; products are grouped by platform
+        membership = np.zeros((len(products), len(platform_names)), dtype=np.int64)
+        offset = 0
+        for col, group in enumerate(platform_products):
+            membership[offset:offset + len(group), col] = 1
+            offset += len(group)
+            
+        commission_per_sale = np.array(
+            [self._stats[p["id"]].commission_per_sale for p in products], dtype=np.float64
+        )
+        sales = self._rng.integers(0, max_daily_sales + 1, size=(n_days, len(products)))
+        return sales @ membership, (sales * commission_per_sale) @ membership
+        
     async def optimize_commissions(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Optimize commission rates for affiliate products.
@@ -412,7 +1103,7 @@ class AffiliateAgent(BaseAgent):
             }
             
         # Get all products for the platform
-        platform_products = [p for p in self.products.values() if p["platform"] == platform]
+        platform_products = self._by_platform.get(platform, [])
         
         if not platform_products:
             return {
@@ -453,49 +1144,41 @@ class AffiliateAgent(BaseAgent):
         # Generate optimization recommendations
         recommendations = []
         
+        # Candidate commission rates to simulate, shared by every product
+        rates = np.arange(int(strategy["min_commission"]), int(strategy["max_commission"]) + 1, 5)
+        
         for product in platform_products:
-            current_commission = product["commission_rate"]
-            current_revenue = product["price"] * (current_commission / 100) * product["conversion_rate"]
-            
-            # Simulate different commission rates
-            test_rates = []
-            for rate in range(int(strategy["min_commission"]), int(strategy["max_commission"]) + 1, 5):
-                # Simulate conversion rate change based on commission rate
-                # Higher commission might lead to lower conversion rate
-                conversion_factor = 1.0
-                if rate > current_commission:
-                    conversion_factor = 0.95 - (rate - current_commission) * 0.01
-                elif rate < current_commission:
-                    conversion_factor = 1.05 + (current_commission - rate) * 0.005
-                    
-                simulated_conversion = product["conversion_rate"] * conversion_factor
-                simulated_revenue = product["price"] * (rate / 100) * simulated_conversion
-                
-                # Calculate score based on weights
-                revenue_score = simulated_revenue / current_revenue if current_revenue > 0 else 0
-                conversion_score = simulated_conversion / product["conversion_rate"]
-                
-                weighted_score = (revenue_score * strategy["revenue_weight"] + 
-                                 conversion_score * strategy["conversion_weight"])
-                
-                test_rates.append({
-                    "commission_rate": rate,
-                    "simulated_conversion": simulated_conversion,
-                    "simulated_revenue": simulated_revenue,
-                    "score": weighted_score
-                })
-                
+            stats = self._stats[product["id"]]
+            current_commission = stats.commission_rate
+            current_revenue = stats.potential_revenue
+            
+            # Simulate conversion rate change based on commission rate
+            # Higher commission might lead to lower conversion rate
+            conversion_factor = np.where(
+                rates > current_commission,
+                0.95 - (rates - current_commission) * 0.01,
+                np.where(rates < current_commission, 1.05 + (current_commission - rates) * 0.005, 1.0)
+            )
+            simulated_conversion = stats.conversion_rate * conversion_factor
+            simulated_revenue = stats.price * (rates / 100) * simulated_conversion
+            
+            # Calculate score based on weights
+            revenue_score = simulated_revenue / current_revenue if current_revenue > 0 else 0
+            scores = revenue_score * strategy["revenue_weight"] + conversion_factor * strategy["conversion_weight"]
+            
             # Find optimal rate
-            optimal_rate = max(test_rates, key=lambda x: x["score"])
+            best = int(scores.argmax())
+            best_score = float(scores[best])
+            best_revenue = float(simulated_revenue[best])
             
             # Generate recommendation
             recommendation = {
                 "product_id": product["id"],
                 "product_name": product["name"],
                 "current_commission_rate": current_commission,
-                "recommended_commission_rate": optimal_rate["commission_rate"],
-                "expected_revenue_change": (optimal_rate["simulated_revenue"] - current_revenue) / current_revenue * 100 if current_revenue > 0 else 0,
-                "confidence": "high" if optimal_rate["score"] > 1.2 else "medium" if optimal_rate["score"] > 1.05 else "low"
+                "recommended_commission_rate": int(rates[best]),
+                "expected_revenue_change": (best_revenue - current_revenue) / current_revenue * 100 if current_revenue > 0 else 0,
+                "confidence": "high" if best_score > 1.2 else "medium" if best_score > 1.05 else "low"
             }
             
             recommendations.append(recommendation)
@@ -547,10 +1230,17 @@ class AffiliateAgent(BaseAgent):
             }
             
         # Generate UTM string
-        utm_string = ""
-        if utm_params:
-            utm_string = "&" + "&".join([f"utm_{key}={value}" for key, value in utm_params.items()])
-            
+        utm_query = urlencode({f"utm_{key}": value for key, value in utm_params.items()})
+        utm_string = f"&{utm_query}" if utm_query else ""
+        
+        # Platform-specific (prefix, suffix) around the product ID, built once per call
+        link_templates = {
+            "clickbank": (f"https://vendor.clickbank.net/{tracking_id}/", f"?{utm_query}" if utm_query else ""),
+            "amazon": ("https://amazon.com/dp/", f"?tag={tracking_id}{utm_string}"),
+            "shareasale": ("https://shareasale.com/r.cfm?b=", f"&u={tracking_id}{utm_string}")
+        }
+        fallback_suffix = f"?tracking={tracking_id}{utm_string}"
+        
         # Generate links
         links = []
         
@@ -558,15 +1248,11 @@ class AffiliateAgent(BaseAgent):
             product = self.products[product_id]
             platform = product["platform"]
             
-            # Generate platform-specific link
-            if platform == "clickbank":
-                link = f"https://vendor.clickbank.net/{tracking_id}/{product_id}{utm_string}"
-            elif platform == "amazon":
-                link = f"https://amazon.com/dp/{product_id}?tag={tracking_id}{utm_string}"
-            elif platform == "shareasale":
-                link = f"https://shareasale.com/r.cfm?b={product_id}&u={tracking_id}{utm_string}"
+            template = link_templates.get(platform)
+            if template is not None:
+                link = template[0] + product_id + template[1]
             else:
-                link = f"{product['url']}?tracking={tracking_id}{utm_string}"
+                link = product["url"] + fallback_suffix
                 
             links.append({
                 "product_id": product_id,
@@ -602,8 +1288,9 @@ class AffiliateAgent(BaseAgent):
             }
             
         product_id = params.get("product_id")
-        start_date = params.get("start_date", (datetime.now() - timedelta(days=30)).isoformat())
-        end_date = params.get("end_date", datetime.now().isoformat())
+        now = datetime.now()
+        start_date = params.get("start_date") or (now - timedelta(days=30)).isoformat()
+        end_date = params.get("end_date") or now.isoformat()
         
         if not product_id:
             return {
@@ -620,11 +1307,12 @@ class AffiliateAgent(BaseAgent):
         product = self.products[product_id]
         
         # Generate simulated funnel data
-        impressions = random.randint(1000, 10000)
-        clicks = int(impressions * random.uniform(0.02, 0.1))
-        add_to_carts = int(clicks * random.uniform(0.1, 0.3))
-        checkouts = int(add_to_carts * random.uniform(0.3, 0.6))
-        purchases = int(checkouts * random.uniform(0.5, 0.9))
+        impressions = int(self._rng.integers(1000, 10001))
+        click_rate, cart_rate, checkout_draw, purchase_draw = self._rng.uniform(FUNNEL_RATE_LOWS, FUNNEL_RATE_HIGHS)
+        clicks = int(impressions * click_rate)
+        add_to_carts = int(clicks * cart_rate)
+        checkouts = int(add_to_carts * checkout_draw)
+        purchases = int(checkouts * purchase_draw)
         
         # Calculate conversion rates
         ctr = clicks / impressions if impressions > 0 else 0
@@ -642,45 +1330,22 @@ class AffiliateAgent(BaseAgent):
             {"stage": "purchases", "count": purchases, "drop_off": checkouts - purchases, "conversion_rate": purchase_rate}
         ]
         
-        # Generate bottleneck analysis
-        bottleneck_stage = min(funnel_stages[1:], key=lambda x: x["conversion_rate"])
+        # Generate bottleneck analysis (first stage with the lowest conversion rate)
+        stage_rates = np.array([ctr, add_to_cart_rate, checkout_rate, purchase_rate])
+        bottleneck_stage = FUNNEL_STAGES[int(stage_rates.argmin())]
         
         # Generate recommendations based on bottleneck
-        recommendations = []
+        recommendations = list(BOTTLENECK_RECOMMENDATIONS[bottleneck_stage])
         
-        if bottleneck_stage["stage"] == "clicks":
-            recommendations = [
-                "Improve ad copy and creative to increase click-through rate",
-                "Test different headlines and images to find what resonates with your audience",
-                "Refine targeting to reach more relevant potential customers"
-            ]
-        elif bottleneck_stage["stage"] == "add_to_carts":
-            recommendations = [
-                "Enhance product landing page to better showcase benefits",
-                "Add more compelling product images and descriptions",
-                "Include customer testimonials and social proof"
-            ]
-        elif bottleneck_stage["stage"] == "checkouts":
-            recommendations = [
-                "Simplify the checkout process to reduce abandonment",
-                "Add trust signals and security badges",
-                "Implement exit-intent popups with special offers"
-            ]
-        elif bottleneck_stage["stage"] == "purchases":
-            recommendations = [
-                "Review pricing strategy and consider limited-time offers",
-                "Add guarantees to reduce purchase anxiety",
-                "Implement abandoned cart email sequences"
-            ]
-            
         # Store conversion data
-        self.conversion_data[product_id] = {
-            "timestamp": datetime.now().isoformat(),
+        self.conversion_data[product_id] = conversion_record = {
+            "timestamp": now.isoformat(),
             "start_date": start_date,
             "end_date": end_date,
             "funnel_stages": funnel_stages,
             "overall_conversion": overall_conversion
         }
+        self._store_conversion_data(product_id, conversion_record)
         
         return {
             "status": "success",
@@ -690,7 +1355,7 @@ class AffiliateAgent(BaseAgent):
             "end_date": end_date,
             "funnel_stages": funnel_stages,
             "overall_conversion_rate": overall_conversion,
-            "bottleneck_stage": bottleneck_stage["stage"],
+            "bottleneck_stage": bottleneck_stage,
             "recommendations": recommendations
         }
         
@@ -719,71 +1384,97 @@ class AffiliateAgent(BaseAgent):
         platform_preference = params.get("platform_preference")
         count = int(params.get("count", 5))
         
+        # Reuse the previous result while the products are unchanged
+        key = (niche, budget, platform_preference, count, self._products_version)
+        if key in self._recommendation_cache:
+            self._recommendation_cache.move_to_end(key)
+            recommendations = self._recommendation_cache[key]
+        else:
+            recommendations = self._recommend_products(niche, budget, platform_preference, count)
+            self._recommendation_cache[key] = recommendations
+            if len(self._recommendation_cache) > RECOMMENDATION_CACHE_MAX_ENTRIES:
+                self._recommendation_cache.popitem(last=False)
+                
+        if recommendations is None:
+            return {
+                "status": "error",
+                "message": "No products match the specified criteria"
+            }
+            
+        # Copy so callers cannot modify the cached entries
+        return {
+            "status": "success",
+            "count": len(recommendations),
+            "recommendations": [dict(recommendation) for recommendation in recommendations]
+        }
+        
+    def _recommend_products(self, niche: Optional[str], budget: float,
+                            platform_preference: Optional[str], count: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Filter, score and rank products for generate_product_recommendations.
+        
+        Args:
+            niche: Target niche (optional)
+            budget: Maximum price (0 for no limit)
+            platform_preference: Preferred platform (optional)
+            count: Number of recommendations to generate
+            
+        Returns:
+            Ranked recommendations, or None if no product matches the criteria
+        """
         # Filter products based on criteria
-        filtered_products = list(self.products.values())
+        self._rebuild_product_arrays()
+        mask = np.ones(len(self._p_ids), dtype=bool)
         
         # Filter by niche if specified
         if niche:
-            filtered_products = [p for p in filtered_products if p["category"] == niche]
+            mask &= self._p_cat_codes == self._p_cat_index.get(niche, -1)
             
         # Filter by budget if specified
         if budget:
-            filtered_products = [p for p in filtered_products if p["price"] <= budget]
+            mask &= self._p_prices <= budget
             
         # Filter by platform if specified
         if platform_preference:
-            filtered_products = [p for p in filtered_products if p["platform"] == platform_preference]
-            
-        if not filtered_products:
-            return {
-                "status": "error",
-                "message": "No products match the specified criteria"
-            }
+            mask &= self._p_plat_codes == self._p_plat_index.get(platform_preference, -1)
             
-        # Score products based on potential revenue and conversion rate
-        scored_products = []
+        candidates = np.flatnonzero(mask)
         
-        for product in filtered_products:
-            potential_revenue = product["price"] * (product["commission_rate"] / 100) * product["conversion_rate"]
-            popularity_score = product["popularity"]
+        if not len(candidates):
+            return None
             
-            # Calculate overall score
-            overall_score = (potential_revenue * 0.6) + (popularity_score * 0.4)
+        # Take the top N by score, then order just those (ties keep catalog order)
+        scores = self._p_scores[candidates]
+        if 0 < count < len(candidates):
+            top = np.argpartition(-scores, count - 1)[:count]
+            candidates, scores = candidates[top], scores[top]
+        elif count <= 0:
+            candidates, scores = candidates[:0], scores[:0]
+        selected = candidates[np.lexsort((candidates, -scores))]
+        
+        # Index into RECOMMENDATION_REASONS for each selected product
+        reasons = np.where(self._p_comm[selected] > 30, 0, np.where(self._p_conv[selected] > 3, 1, 2))
+        
+        # Sized once; potential revenue comes from the precomputed stats
+        recommendations = [None] * len(selected)
+        
+        for idx, (i, reason) in enumerate(zip(selected, reasons)):
+            product = self.products[self._p_ids[i]]
+            stats = self._stats[product["id"]]
             
-            scored_products.append({
-                "product": product,
-                "score": overall_score
-            })
-            
-        # Sort by score and take top N
-        scored_products.sort(key=lambda x: x["score"], reverse=True)
-        top_products = scored_products[:count]
-        
-        recommendations = []
-        
-        for idx, item in enumerate(top_products):
-            product = item["product"]
-            score = item["score"]
-            
-            recommendation = {
+            recommendations[idx] = {
                 "rank": idx + 1,
                 "product_id": product["id"],
-                "product_name": product["name"],
+                "product_name": product.get("name"),
                 "platform": product["platform"],
-                "price": product["price"],
-                "commission_rate": product["commission_rate"],
-                "potential_revenue": product["price"] * (product["commission_rate"] / 100) * product["conversion_rate"],
-                "recommendation_score": score,
-                "reason": "High commission rate" if product["commission_rate"] > 30 else "Good conversion rate" if product["conversion_rate"] > 3 else "Popular product"
+                "price": stats.price,
+                "commission_rate": stats.commission_rate,
+                "potential_revenue": stats.potential_revenue,
+                "recommendation_score": float(self._p_scores[i]),
+                "reason": RECOMMENDATION_REASONS[reason]
             }
             
-            recommendations.append(recommendation)
-            
-        return {
-            "status": "success",
-            "count": len(recommendations),
-            "recommendations": recommendations
-        }
+        return recommendations
         
     async def create_ab_test(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -832,35 +1523,27 @@ class AffiliateAgent(BaseAgent):
         test_id = f"test_{test_name.lower().replace(' ', '_')}_{int(time.time())}"
         
         # Configure test
+        now = datetime.now()
         test_config = {
             "id": test_id,
             "name": test_name,
             "type": test_type,
             "variants": variants,
-            "start_date": datetime.now().isoformat(),
-            "end_date": (datetime.now() + timedelta(days=duration_days)).isoformat(),
+            "start_date": now.isoformat(),
+            "end_date": (now + timedelta(days=duration_days)).isoformat(),
             "status": "running",
             "metrics": {},
             "winner": None
         }
         
         # Initialize metrics for each variant
-        for variant in variants:
-            variant_id = variant.get("id", f"variant_{variants.index(variant) + 1}")
-            test_config["metrics"][variant_id] = {
-                "impressions": 0,
-                "clicks": 0,
-                "conversions": 0,
-                "revenue": 0.0,
-                "ctr": 0.0,
-                "conversion_rate": 0.0
-            }
+        for idx, variant in enumerate(variants):
+            variant_id = variant.get("id") or f"variant_{idx + 1}"
+            test_config["metrics"][variant_id] = dict(AB_EMPTY_VARIANT_METRICS)
             
         # Store test configuration
-        if not hasattr(self, "ab_tests"):
-            self.ab_tests = {}
-            
         self.ab_tests[test_id] = test_config
+        self._store_ab_test(test_config)
         
         return {
             "status": "success",
@@ -897,7 +1580,7 @@ class AffiliateAgent(BaseAgent):
                 "message": "No test ID specified"
             }
             
-        if not hasattr(self, "ab_tests") or test_id not in self.ab_tests:
+        if test_id not in self.ab_tests:
             return {
                 "status": "error",
                 "message": f"Test not found: {test_id}"
@@ -924,19 +1607,9 @@ class AffiliateAgent(BaseAgent):
             }
             
         # Update metrics
-        for key, value in metrics.items():
-            if key in test["metrics"][variant_id]:
-                test["metrics"][variant_id][key] += value
-                
-        # Recalculate derived metrics
-        variant_metrics = test["metrics"][variant_id]
+        self._apply_variant_deltas(test["metrics"][variant_id], metrics)
+        self._store_ab_test(test)
         
-        if variant_metrics["impressions"] > 0:
-            variant_metrics["ctr"] = variant_metrics["clicks"] / variant_metrics["impressions"]
-            
-        if variant_metrics["clicks"] > 0:
-            variant_metrics["conversion_rate"] = variant_metrics["conversions"] / variant_metrics["clicks"]
-            
         return {
             "status": "success",
             "test_id": test_id,
@@ -944,6 +1617,97 @@ class AffiliateAgent(BaseAgent):
             "updated_metrics": test["metrics"][variant_id]
         }
         
+    async def update_ab_test_metrics_bulk(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Apply many A/B test metric updates at once.
+        
+        Updates for the same test variant are summed first, so each variant
+        is validated and has its derived metrics recalculated only once.
+        
+        Args:
+            params: Update parameters
+                - updates: List of {test_id, variant_id, metrics} updates
+                
+        Returns:
+            Dict containing one result per updated test variant
+        """
+        if not params or not params.get("updates"):
+            return {
+                "status": "error",
+                "message": "No updates provided"
+            }
+            
+        # Sum the deltas per (test_id, variant_id), keeping arrival order
+        grouped = defaultdict(lambda: defaultdict(int))
+        for update in params["updates"]:
+            deltas = grouped[(update.get("test_id"), update.get("variant_id"))]
+            for key, value in update.get("metrics", {}).items():
+                deltas[key] += value
+                
+        ab_tests = self.ab_tests
+        results = []
+        failed = 0
+        
+        updated_tests = {}
+        
+        for (test_id, variant_id), deltas in grouped.items():
+            test = ab_tests.get(test_id)
+            
+            if test is None:
+                message = f"Test not found: {test_id}"
+            elif test["status"] != "running":
+                message = f"Test is not running: {test_id}"
+            elif variant_id not in test["metrics"]:
+                message = f"Variant not found: {variant_id}"
+            else:
+                self._apply_variant_deltas(test["metrics"][variant_id], deltas)
+                updated_tests[test_id] = test
+                results.append({
+                    "status": "success",
+                    "test_id": test_id,
+                    "variant_id": variant_id,
+                    "updated_metrics": test["metrics"][variant_id]
+                })
+                continue
+                
+            failed += 1
+            results.append({
+                "status": "error",
+                "test_id": test_id,
+                "variant_id": variant_id,
+                "message": message
+            })
+            
+        # Persist each touched test once
+        for test in updated_tests.values():
+            self._store_ab_test(test)
+            
+        return {
+            "status": "success" if failed < len(results) else "error",
+            "updated": len(results) - failed,
+            "failed": failed,
+            "results": results
+        }
+        
+    @staticmethod
+    def _apply_variant_deltas(variant_metrics: Dict[str, Any], deltas: Dict[str, Any]) -> None:
+        """
+        Add metric deltas to a variant and recalculate its derived rates.
+        
+        Args:
+            variant_metrics: Metrics of the variant (updated in place)
+            deltas: Amounts to add; unknown keys are ignored
+        """
+        for key, value in deltas.items():
+            if key in variant_metrics:
+                variant_metrics[key] += value
+                
+        if variant_metrics["impressions"] > 0:
+            variant_metrics["ctr"] = variant_metrics["clicks"] / variant_metrics["impressions"]
+            
+        if variant_metrics["clicks"] > 0:
+            variant_metrics["conversion_rate"] = variant_metrics["conversions"] / variant_metrics["clicks"]
+            
     async def analyze_ab_test_results(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Analyze the results of an A/B test.
@@ -971,7 +1735,7 @@ class AffiliateAgent(BaseAgent):
                 "message": "No test ID specified"
             }
             
-        if not hasattr(self, "ab_tests") or test_id not in self.ab_tests:
+        if test_id not in self.ab_tests:
             return {
                 "status": "error",
                 "message": f"Test not found: {test_id}"
@@ -979,7 +1743,7 @@ class AffiliateAgent(BaseAgent):
             
         test = self.ab_tests[test_id]
         
-        # Extract metrics for all variants
+        # Variant counters and rates are kept current by update_ab_test_metrics
         variants_metrics = test["metrics"]
         
         if not variants_metrics:
@@ -993,45 +1757,51 @@ class AffiliateAgent(BaseAgent):
         best_variant_id = best_variant[0]
         best_variant_metrics = best_variant[1]
         
-        # Calculate statistical significance (simplified)
-        # In a real implementation, this would use proper statistical tests
-        significant = True
+        # Test the best variant against every other one (conversions per click);
+        # a single variant has nothing to be significant against
+        alpha = 1 - confidence_level
+        comparisons = {}
+        significant = len(variants_metrics) > 1
+        best_conversions = best_variant_metrics["conversions"]
+        best_clicks = best_variant_metrics["clicks"]
         for variant_id, metrics in variants_metrics.items():
             if variant_id == best_variant_id:
                 continue
                 
-            # Simple check: if the difference is less than 20%, consider it not significant
-            if best_variant_metrics["conversion_rate"] > 0 and metrics["conversion_rate"] > 0:
-                difference = (best_variant_metrics["conversion_rate"] - metrics["conversion_rate"]) / metrics["conversion_rate"]
-                if difference < 0.2:
-                    significant = False
-                    break
-                    
-        # Update test status
-        test["status"] = "completed"
-        test["completion_date"] = datetime.now().isoformat()
-        test["winner"] = best_variant_id if significant else None
-        test["significant"] = significant
-        
-        # Generate insights
-        insights = []
-        
-        if significant:
-            insights.append(f"Variant {best_variant_id} is the clear winner with a conversion rate of {best_variant_metrics['conversion_rate']:.2%}")
-            insights.append(f"The winning variant generated {best_variant_metrics['revenue']:.2f} in revenue")
-        else:
-            insights.append("No statistically significant difference between variants")
-            insights.append("Consider running the test longer or with more traffic")
+            z_score, p_value = two_proportion_z_test(
+                best_conversions, best_clicks, metrics["conversions"], metrics["clicks"]
+            )
+            comparisons[variant_id] = {
+                "z_score": z_score,
+                "p_value": p_value
+            }
             
-        # Generate recommendations
-        recommendations = []
-        
+            if not (z_score > 0 and p_value < alpha):
+                significant = False
+                
+        # The first analysis completes the test and records its outcome;
+        # re-analysis at another confidence level leaves the stored test alone
+        winner = best_variant_id if significant else None
+        if test["status"] != "completed":
+            test["status"] = "completed"
+            test["completion_date"] = datetime.now().isoformat()
+            test["winner"] = winner
+            test["significant"] = significant
+            self._store_ab_test(test)
+        
+        # Generate insights and recommendations
         if significant:
-            recommendations.append(f"Implement variant {best_variant_id} as the new standard")
-            recommendations.append("Apply learnings from the winning variant to other marketing materials")
+            insights = [
+                f"Variant {best_variant_id} is the clear winner with a conversion rate of {best_variant_metrics['conversion_rate']:.2%}",
+                f"The winning variant generated {best_variant_metrics['revenue']:.2f} in revenue"
+            ]
+            recommendations = [
+                f"Implement variant {best_variant_id} as the new standard",
+                AB_WINNER_RECOMMENDATION
+            ]
         else:
-            recommendations.append("Refine test variants to create more differentiation")
-            recommendations.append("Analyze user segments to see if certain audiences prefer different variants")
+            insights = list(AB_INCONCLUSIVE_INSIGHTS)
+            recommendations = list(AB_INCONCLUSIVE_RECOMMENDATIONS)
             
         return {
             "status": "success",
@@ -1042,9 +1812,10 @@ class AffiliateAgent(BaseAgent):
             "end_date": test["completion_date"],
             "variants": test["variants"],
             "metrics": variants_metrics,
-            "winner": test["winner"],
+            "winner": winner,
             "statistically_significant": significant,
             "confidence_level": confidence_level,
+            "comparisons": comparisons,
             "insights": insights,
             "recommendations": recommendations
         }
@@ -7,12 +7,70 @@ will inherit from, providing common functionality and interfaces.
 
 import logging
 import asyncio
+import os
 from typing import Dict, List, Any, Optional
 from abc import ABC, abstractmethod
 
 # Configure logging (configured centrally in main application)
 logger = logging.getLogger(__name__)
 
+A2A_RESOLVER_URL = os.getenv("A2A_RESOLVER_URL", "http://localhost:8000/invoke")
+MCP_TIMEOUT = 10.0
+MCP_MAX_KEEPALIVE = 64
+
+# Default smoothing factor for the per-action execution time average
+DEFAULT_METRICS_EWMA_ALPHA = 0.05
+
+# Shared MCP clients, one per event loop (a client cannot be used from another loop)
+_mcp_clients = {}
+
+def _get_mcp_client():
+    """
+    Return the shared httpx client for MCP calls, creating it on first use.
+    
+    A client is tied to the event loop it was created on, so each loop gets
+    its own client; clients of other loops stay open until close_mcp_client().
+    Clients whose loop has already closed can no longer be used or closed,
+    so they are dropped.
+    """
+    import httpx
+    
+    for closed_loop in [client_loop for client_loop in _mcp_clients if client_loop.is_closed()]:
+        logger.warning("Dropping MCP client whose event loop closed without close_mcp_client()")
+        del _mcp_clients[closed_loop]
+        
+    loop = asyncio.get_running_loop()
+    client = _mcp_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _mcp_clients[loop] = httpx.AsyncClient(
+            timeout=MCP_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=MCP_MAX_KEEPALIVE)
+        )
+    return client
+
+async def close_mcp_client() -> None:
+    """
+    Close the shared MCP clients of every event loop.
+    
+    Call this before an event loop that made MCP calls is closed: a client
+    whose loop has already closed can no longer be closed cleanly.
+    """
+    loop = asyncio.get_running_loop()
+    clients = list(_mcp_clients.items())
+    _mcp_clients.clear()
+    
+    for client_loop, client in clients:
+        if client_loop.is_closed():
+            continue
+        try:
+            if client_loop is loop or not client_loop.is_running():
+                await client.aclose()
+            else:
+                # Close on the loop that owns the client's connections
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), client_loop))
+        except Exception as e:
+            logger.warning(f"Error closing MCP client: {e}")
+
 class BaseAgent(ABC):
     """
     Base class for all marketing agents in the system.
@@ -33,6 +91,7 @@ class BaseAgent(ABC):
         self.actions = {}
         self.knowledge_graph = None
         self.metrics = {}
+        self._ewma_alpha = config.get("metrics_ewma_alpha", DEFAULT_METRICS_EWMA_ALPHA)
         self._register_actions()
         logger.info(f"Initialized agent: {self.name}")
         
@@ -77,7 +136,8 @@ class BaseAgent(ABC):
         Returns:
             Dict containing action execution results
         """
-        if action_name not in self.actions:
+        action_func = self.actions.get(action_name)
+        if action_func is None:
             logger.error(f"Action {action_name} not found in agent {self.name}")
             return {
                 "status": "error",
@@ -85,8 +145,7 @@ class BaseAgent(ABC):
             }
             
         try:
-            action_func = self.actions[action_name]
-            result = await action_func(**(params or {}))
+            result = await action_func(**params) if params else await action_func()
             
             # Update metrics
             self._update_metrics(action_name, result)
@@ -104,6 +163,10 @@ class BaseAgent(ABC):
         """
         Update agent metrics based on action execution.
         
+        avg_execution_time is an exponentially weighted moving average
+        (weight self._ewma_alpha on the newest sample), seeded with the
+        first timed execution.
+        
         Args:
             action_name: Name of the executed action
             result: Result of the action execution
@@ -127,8 +190,10 @@ class BaseAgent(ABC):
         if "execution_time" in result:
             # Update average execution time
             avg_time = metrics["avg_execution_time"]
-            executions = metrics["executions"]
-            metrics["avg_execution_time"] = (avg_time * (executions - 1) + result["execution_time"]) / executions
+            if avg_time == 0:
+                metrics["avg_execution_time"] = result["execution_time"]
+            else:
+                metrics["avg_execution_time"] = avg_time + self._ewma_alpha * (result["execution_time"] - avg_time)
             
     def get_metrics(self) -> Dict[str, Any]:
         """
@@ -142,14 +207,13 @@ class BaseAgent(ABC):
     async def call_mcp(self, mcp_id: str, capability: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Invoke an MCP service via the A2A resolver.
+        
+        Calls on the same event loop share one pooled client; call close_mcp_client() on shutdown.
         """
-        import os, httpx
-        resolver_url = os.getenv("A2A_RESOLVER_URL", "http://localhost:8000/invoke")
         payload = {"agent": mcp_id, "capability": capability, "params": params or {}}
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(resolver_url, json=payload)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await _get_mcp_client().post(A2A_RESOLVER_URL, json=payload)
+        resp.raise_for_status()
+        return resp.json()
         
     @abstractmethod
     async def initialize(self) -> Dict[str, Any]:
@@ -6,17 +6,401 @@ optimization, and management across various marketing channels.
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import json
 import os
-from datetime import datetime
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
+import re
+import time
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from core.agents.base_agent import BaseAgent
 
 # Configure logging (configured centrally in main application)
 logger = logging.getLogger(__name__)
 
+# Default templates for common content types
+DEFAULT_CONTENT_TEMPLATES = {
+    "blog": {
+        "structure": ["title", "introduction", "main_points", "conclusion"],
+        "title_format": "{topic}: {benefit} for {audience}",
+        "introduction_format": "Introduction about {topic} highlighting {pain_point} and {solution}.",
+        "main_points_format": "Main points about {topic} with {examples} and {statistics}.",
+        "conclusion_format": "Conclusion summarizing {key_points} with {call_to_action}."
+    },
+    "social": {
+        "structure": ["hook", "value", "call_to_action"],
+        "hook_format": "Attention-grabbing statement about {topic}.",
+        "value_format": "Value proposition related to {topic}.",
+        "call_to_action_format": "Call to action encouraging {desired_action}."
+    },
+    "email": {
+        "structure": ["subject", "greeting", "body", "closing", "signature"],
+        "subject_format": "{benefit} for {audience} with {topic}",
+        "greeting_format": "Hello {audience},",
+        "body_format": "Email body about {topic} highlighting {pain_point} and {solution}.",
+        "closing_format": "Closing with {call_to_action}.",
+        "signature_format": "Best regards,\n{sender_name}"
+    }
+}
+
+# Content brief outlines: content type -> (section, description) formats
+CONTENT_OUTLINES = {
+    "blog": (
+        ("Introduction", "Introduction to {topic}"),
+        ("What is {topic}", "Definition and explanation of {topic}"),
+        ("Benefits of {topic}", "Key benefits and advantages of {topic}"),
+        ("How to implement {topic}", "Step-by-step guide to implementing {topic}"),
+        ("Case studies", "Real-world examples of {topic} in action"),
+        ("Conclusion", "Summary and next steps for {topic}")
+    ),
+    "social": (
+        ("Hook", "Attention-grabbing statement about {topic}"),
+        ("Value", "Key value proposition related to {topic}"),
+        ("Call to Action", "Clear call to action related to {topic}")
+    ),
+    "email": (
+        ("Subject Line", "Compelling subject line about {topic}"),
+        ("Introduction", "Brief introduction to {topic}"),
+        ("Main Content", "Key information about {topic}"),
+        ("Call to Action", "Clear call to action related to {topic}"),
+        ("Closing", "Brief closing statement")
+    )
+}
+DEFAULT_CONTENT_OUTLINE = (
+    ("Main Content", "Content about {topic}"),
+)
+
+# Recommended tone and style by content type
+TONE_AND_STYLE = {
+    "blog": {
+        "tone": "informative and conversational",
+        "style": "educational with practical examples",
+        "voice": "second person (you/your)",
+        "formality": "semi-formal"
+    },
+    "social": {
+        "tone": "engaging and concise",
+        "style": "direct and attention-grabbing",
+        "voice": "first person (we/our) or second person (you/your)",
+        "formality": "casual"
+    },
+    "email": {
+        "tone": "personal and direct",
+        "style": "clear and action-oriented",
+        "voice": "second person (you/your)",
+        "formality": "business casual"
+    }
+}
+DEFAULT_TONE_AND_STYLE = {
+    "tone": "professional",
+    "style": "clear and concise",
+    "voice": "third person",
+    "formality": "formal"
+}
+
+# Recommended content length by content type
+CONTENT_LENGTHS = {
+    "blog": {
+        "word_count": "1000-2000 words",
+        "sections": "5-7 sections",
+        "paragraphs_per_section": "2-4 paragraphs"
+    },
+    "social": {
+        "word_count": "50-100 words",
+        "sections": "1 section",
+        "paragraphs_per_section": "1-2 paragraphs"
+    },
+    "email": {
+        "word_count": "200-500 words",
+        "sections": "3-5 sections",
+        "paragraphs_per_section": "1-2 paragraphs"
+    }
+}
+DEFAULT_CONTENT_LENGTH = {
+    "word_count": "500-1000 words",
+    "sections": "3-5 sections",
+    "paragraphs_per_section": "1-3 paragraphs"
+}
+
+# Placeholders used in template formats and their default fill-ins
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+PLACEHOLDER_DEFAULTS = {
+    "audience": "target audience",
+    "benefit": "key benefit",
+    "pain_point": "common pain point",
+    "solution": "proposed solution",
+    "examples": "relevant examples",
+    "statistics": "supporting statistics",
+    "key_points": "key points",
+    "call_to_action": "call to action",
+    "desired_action": "desired action",
+    "sender_name": "Sender Name"
+}
+
+# Placeholders filled in per call rather than from the defaults
+CALL_PLACEHOLDERS = frozenset({"topic", "keywords"})
+
+# Maximum number of distinct template formats kept compiled
+COMPILED_FORMAT_CACHE_SIZE = 256
+
+# Maximum number of distinct calendar dates kept parsed
+ISO_PARSE_CACHE_SIZE = 256
+
+# Simulated performance metric ranges: metric -> (low, high, integer-valued)
+SIMULATED_METRIC_RANGES = {
+    "views": (100, 10000, True),
+    "engagement": (0.01, 0.2, False),
+    "shares": (5, 500, True),
+    "comments": (0, 100, True),
+    "conversions": (1, 50, True),
+    "time_on_page": (10, 300, False)
+}
+DEFAULT_SIMULATED_METRIC_RANGE = (1, 100, True)
+
+# Rows initially allocated per metric in the content metrics store
+METRICS_STORE_INITIAL_CAPACITY = 64
+
+# Content optimization rules: (condition, recommendation), evaluated in order.
+# Conditions receive the content analysis, target platform and optimization goals.
+OPTIMIZATION_RULES = [
+    # Word count based on platform
+    (lambda analysis, platform, goals: platform == "blog" and analysis["word_count"] < 500,
+     {"type": "word_count",
+      "message": "Content is too short for a blog post. Aim for at least 1000 words for better engagement."}),
+    (lambda analysis, platform, goals: platform == "social" and analysis["word_count"] > 100,
+     {"type": "word_count",
+      "message": "Content is too long for social media. Keep it under 100 words for better engagement."}),
+    # Readability
+    (lambda analysis, platform, goals: analysis["readability"] < 50,
+     {"type": "readability",
+      "message": "Content readability is low. Simplify sentences and use more common words."}),
+    # Sentiment based on goals
+    (lambda analysis, platform, goals: "engagement" in goals and analysis["sentiment"] == "neutral",
+     {"type": "sentiment",
+      "message": "Content sentiment is neutral. Consider using more emotionally engaging language for better engagement."})
+]
+
+# Maximum number of content analyses kept for reuse
+ANALYSIS_CACHE_MAX_ENTRIES = 1024
+
+# Word lists for the simplified sentiment analysis
+WORD_PATTERN = re.compile(r"[a-z']+")
+POSITIVE_WORDS = frozenset({"good", "great", "excellent", "amazing", "wonderful", "best", "positive"})
+NEGATIVE_WORDS = frozenset({"bad", "poor", "terrible", "worst", "negative", "awful", "horrible"})
+
+@lru_cache(maxsize=COMPILED_FORMAT_CACHE_SIZE)
+def _compile_format(template_format: str) -> Tuple[str, ...]:
+    """
+    Compile a template format into literal text and per-call placeholders.
+    
+    Default placeholders are substituted here, once per format. The result
+    alternates literal text (even indices) with the names of the placeholders
+    in CALL_PLACEHOLDERS (odd indices); unknown placeholders stay as literal text.
+    """
+    pieces = PLACEHOLDER_PATTERN.split(template_format)
+    parts = [pieces[0]]
+    for name, text in zip(pieces[1::2], pieces[2::2]):
+        if name in CALL_PLACEHOLDERS:
+            parts.extend((name, text))
+        else:
+            parts[-1] += PLACEHOLDER_DEFAULTS.get(name, "{" + name + "}") + text
+            
+    return tuple(parts)
+
+@lru_cache(maxsize=ISO_PARSE_CACHE_SIZE)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 date string; datetimes are immutable, so results are shared."""
+    return datetime.fromisoformat(value)
+
+@dataclass
+class CalendarItem:
+    """A planned piece of content in a content calendar."""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10, and a
+    # slotted field cannot carry a class-level default, so status is required
+    __slots__ = ("date", "content_type", "topic", "status")
+    
+    date: str
+    content_type: str
+    topic: str
+    status: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for API responses and the knowledge graph."""
+        return {
+            "date": self.date,
+            "content_type": self.content_type,
+            "topic": self.topic,
+            "status": self.status
+        }
+
+def _load_json(path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as file:
+            return orjson.loads(file.read())
+    with open(path, 'r') as file:
+        return json.load(file)
+
+def _dump_json(path: str, data: Any) -> None:
+    """Write data to a JSON file, using orjson when it is installed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w') as file:
+        json.dump(data, file, default=asdict)
+
+def _dump_json_mapping(path: str, data: Dict[str, Any]) -> None:
+    """
+    Write a dict to a JSON file one entry at a time.
+    
+    Only one entry is serialized in memory at once, so peak memory is bounded
+    by the largest value rather than the whole mapping.
+    """
+    if not ORJSON_AVAILABLE:
+        _dump_json(path, data)
+        return
+        
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as file:
+        file.write(b"{")
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                file.write(b",")
+            # Serialize a single-entry dict and strip its braces
+            file.write(orjson.dumps({key: value}, option=orjson.OPT_NON_STR_KEYS)[1:-1])
+        file.write(b"}")
+
+class MetricsStore:
+    """
+    Column-oriented store of the latest performance metrics of each content item.
+    
+    Each metric is a NumPy array with one row per content item plus a mask of the
+    rows holding a value, so aggregates over all content run on contiguous arrays
+    instead of per-item dicts.
+    """
+    
+    def __init__(self, capacity: int = METRICS_STORE_INITIAL_CAPACITY):
+        """
+        Initialize an empty store.
+        
+        Args:
+            capacity: Initial number of rows allocated per metric
+        """
+        self._rows: Dict[str, int] = {}
+        self._periods: List[Optional[str]] = []
+        self._values: Dict[str, np.ndarray] = {}
+        self._present: Dict[str, np.ndarray] = {}
+        self._capacity = capacity
+        
+    def __len__(self) -> int:
+        return len(self._rows)
+        
+    def __contains__(self, content_id: str) -> bool:
+        return content_id in self._rows
+        
+    def update(self, content_ids: List[str], period: str, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Record a new analysis for a batch of content, replacing earlier metrics.
+        
+        Args:
+            content_ids: IDs of the analyzed content
+            period: Time period of the analysis
+            columns: Metric name -> values aligned with content_ids
+        """
+        rows = self._row_indices(content_ids)
+        for row in rows.tolist():
+            self._periods[row] = period
+            
+        for present in self._present.values():
+            present[rows] = False
+            
+        for metric, values in columns.items():
+            if metric not in self._values:
+                self._values[metric] = np.zeros(self._capacity, dtype=values.dtype)
+                self._present[metric] = np.zeros(self._capacity, dtype=bool)
+            self._values[metric][rows] = values
+            self._present[metric][rows] = True
+            
+    def get(self, content_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest metrics of a content item.
+        
+        Args:
+            content_id: ID of the content
+            
+        Returns:
+            Dict with content_id, period and each recorded metric, or None if unknown
+        """
+        row = self._rows.get(content_id)
+        if row is None:
+            return None
+            
+        metrics = {"content_id": content_id, "period": self._periods[row]}
+        for metric, values in self._values.items():
+            if self._present[metric][row]:
+                metrics[metric] = values[row].item()
+                
+        return metrics
+        
+    def column(self, metric: str) -> np.ndarray:
+        """
+        Get the recorded values of a metric across all content.
+        
+        Args:
+            metric: Metric name
+            
+        Returns:
+            Array of the values of the content items that have the metric
+        """
+        if metric not in self._values:
+            return np.empty(0)
+            
+        size = len(self._rows)
+        return self._values[metric][:size][self._present[metric][:size]]
+        
+    def _row_indices(self, content_ids: List[str]) -> np.ndarray:
+        """Map content IDs to rows, assigning rows to new IDs."""
+        rows = np.empty(len(content_ids), dtype=np.intp)
+        for index, content_id in enumerate(content_ids):
+            row = self._rows.get(content_id)
+            if row is None:
+                row = self._rows[content_id] = len(self._rows)
+                self._periods.append(None)
+            rows[index] = row
+            
+        if len(self._rows) > self._capacity:
+            self._grow(len(self._rows))
+            
+        return rows
+        
+    def _grow(self, size: int) -> None:
+        """Double the row capacity until it holds size rows."""
+        capacity = self._capacity
+        while capacity < size:
+            capacity *= 2
+            
+        for columns in (self._values, self._present):
+            for metric, column in columns.items():
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[:self._capacity] = column
+                columns[metric] = grown
+                
+        self._capacity = capacity
+        
 class ContentAgent(BaseAgent):
     """
     Agent responsible for content creation and management.
@@ -38,7 +422,14 @@ class ContentAgent(BaseAgent):
         super().__init__(config)
         self.content_calendar = {}
         self.content_templates = {}
-        self.content_metrics = {}
+        self.content_metrics = MetricsStore()
+        
+        # Shared generator for simulated data
+        self._rng = np.random.default_rng()
+        
+        # Analyses of recently seen content: (content, content_type) -> analysis
+        self._analysis_cache = OrderedDict()
+        
         logger.info("Content Agent initialized")
         
     def _register_actions(self) -> None:
@@ -59,17 +450,21 @@ class ContentAgent(BaseAgent):
             Dict containing initialization status
         """
         try:
+            loop = asyncio.get_running_loop()
+            
             # Load content templates if available
             templates_path = self.config.get("templates_path")
             if templates_path and os.path.exists(templates_path):
-                with open(templates_path, 'r') as file:
-                    self.content_templates = json.load(file)
+                self.content_templates = await loop.run_in_executor(None, _load_json, templates_path)
                     
             # Load content calendar if available
             calendar_path = self.config.get("calendar_path")
             if calendar_path and os.path.exists(calendar_path):
-                with open(calendar_path, 'r') as file:
-                    self.content_calendar = json.load(file)
+                calendars = await loop.run_in_executor(None, _load_json, calendar_path)
+                self.content_calendar = {
+                    calendar_id: [CalendarItem(**item) for item in items]
+                    for calendar_id, items in calendars.items()
+                }
                     
             return {"status": "success", "message": "Content Agent initialized successfully"}
         except Exception as e:
@@ -84,19 +479,17 @@ class ContentAgent(BaseAgent):
             Dict containing shutdown status
         """
         try:
+            loop = asyncio.get_running_loop()
+            
             # Save content templates
             templates_path = self.config.get("templates_path")
             if templates_path:
-                os.makedirs(os.path.dirname(templates_path), exist_ok=True)
-                with open(templates_path, 'w') as file:
-                    json.dump(self.content_templates, file)
+                await loop.run_in_executor(None, _dump_json, templates_path, self.content_templates)
                     
             # Save content calendar
             calendar_path = self.config.get("calendar_path")
             if calendar_path:
-                os.makedirs(os.path.dirname(calendar_path), exist_ok=True)
-                with open(calendar_path, 'w') as file:
-                    json.dump(self.content_calendar, file)
+                await loop.run_in_executor(None, _dump_json_mapping, calendar_path, self.content_calendar)
                     
             return {"status": "success", "message": "Content Agent shut down successfully"}
         except Exception as e:
@@ -122,7 +515,7 @@ class ContentAgent(BaseAgent):
         Returns:
             Dict containing generated content
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
             # Get content template
@@ -132,6 +525,8 @@ class ContentAgent(BaseAgent):
             # In a real implementation, this would use NLP models or APIs
             content = self._generate_content_from_template(template, topic, keywords, tone, length)
             
+            now = datetime.now()
+            
             # Generate metadata
             metadata = {
                 "content_type": content_type,
@@ -139,12 +534,12 @@ class ContentAgent(BaseAgent):
                 "keywords": keywords,
                 "tone": tone,
                 "length": length,
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": now.isoformat(),
                 "word_count": len(content.split())
             }
             
             # Generate content ID
-            content_id = f"{content_type}_{topic.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            content_id = f"{content_type}_{topic.replace(' ', '_')}_{now.strftime('%Y%m%d%H%M%S')}"
             
             # Update knowledge graph
             if self.knowledge_graph:
@@ -160,12 +555,9 @@ class ContentAgent(BaseAgent):
                 self.knowledge_graph.add_edge("content", content_id, {"type": "contains"})
                 
                 # Connect to keywords
-                for keyword in keywords:
-                    keyword_id = f"keyword_{keyword.replace(' ', '_')}"
-                    if keyword_id in self.knowledge_graph.graph:
-                        self.knowledge_graph.add_edge(content_id, keyword_id, {"type": "targets"})
+                self._link_keywords(content_id, keywords)
                     
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "content_id": content_id,
@@ -196,7 +588,7 @@ class ContentAgent(BaseAgent):
         Returns:
             Dict containing optimized content
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
             # Analyze content
@@ -210,7 +602,7 @@ class ContentAgent(BaseAgent):
             # Apply optimizations
             optimized_content = self._apply_content_optimizations(content, recommendations)
             
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "original_content": content,
@@ -242,7 +634,7 @@ class ContentAgent(BaseAgent):
         Returns:
             Dict containing content calendar
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
             # Generate content calendar
@@ -253,6 +645,7 @@ class ContentAgent(BaseAgent):
             # Update content calendar
             calendar_id = f"calendar_{start_date}_{end_date}"
             self.content_calendar[calendar_id] = calendar
+            calendar_items = [item.to_dict() for item in calendar]
             
             # Update knowledge graph
             if self.knowledge_graph:
@@ -261,17 +654,17 @@ class ContentAgent(BaseAgent):
                     "type": "content_calendar",
                     "start_date": start_date,
                     "end_date": end_date,
-                    "calendar": calendar
+                    "calendar": calendar_items
                 })
                 
                 # Connect to content category
                 self.knowledge_graph.add_edge("content", calendar_id, {"type": "contains"})
                 
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "calendar_id": calendar_id,
-                "calendar": calendar,
+                "calendar": calendar_items,
                 "execution_time": execution_time
             }
         except Exception as e:
@@ -293,26 +686,31 @@ class ContentAgent(BaseAgent):
         Returns:
             Dict containing content performance analysis
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
             # Analyze content performance
             # In a real implementation, this would use analytics APIs
+            columns = self._simulate_content_performance(content_ids, metrics)
+            
+            # Update content metrics
+            self.content_metrics.update(content_ids, period, columns)
+            
+            values = {metric: column.tolist() for metric, column in columns.items()}
             performance = {}
             
-            for content_id in content_ids:
-                performance[content_id] = self._simulate_content_performance(content_id, metrics, period)
-                
-                # Update content metrics
-                self.content_metrics[content_id] = performance[content_id]
-                
+            for index, content_id in enumerate(content_ids):
+                performance[content_id] = {"content_id": content_id, "period": period}
+                for metric, metric_values in values.items():
+                    performance[content_id][metric] = metric_values[index]
+                    
                 # Update knowledge graph
                 if self.knowledge_graph and content_id in self.knowledge_graph.graph:
                     self.knowledge_graph.update_node(content_id, {
                         "performance": performance[content_id]
                     })
                     
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "content_analyzed": len(content_ids),
@@ -342,7 +740,7 @@ class ContentAgent(BaseAgent):
         Returns:
             Dict containing content brief
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
             # Analyze competitors if provided
@@ -353,6 +751,8 @@ class ContentAgent(BaseAgent):
                         competitor, topic, content_type
                     )
                     
+            now = datetime.now()
+            
             # Generate content brief
             brief = {
                 "topic": topic,
@@ -363,11 +763,11 @@ class ContentAgent(BaseAgent):
                 "tone_and_style": self._recommend_tone_and_style(target_audience, content_type),
                 "recommended_length": self._recommend_content_length(content_type),
                 "competitor_analysis": competitor_analysis,
-                "created_at": datetime.now().isoformat()
+                "created_at": now.isoformat()
             }
             
             # Generate brief ID
-            brief_id = f"brief_{topic.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            brief_id = f"brief_{topic.replace(' ', '_')}_{now.strftime('%Y%m%d%H%M%S')}"
             
             # Update knowledge graph
             if self.knowledge_graph:
@@ -383,12 +783,9 @@ class ContentAgent(BaseAgent):
                 self.knowledge_graph.add_edge("content", brief_id, {"type": "contains"})
                 
                 # Connect to keywords
-                for keyword in keywords:
-                    keyword_id = f"keyword_{keyword.replace(' ', '_')}"
-                    if keyword_id in self.knowledge_graph.graph:
-                        self.knowledge_graph.add_edge(brief_id, keyword_id, {"type": "targets"})
+                self._link_keywords(brief_id, keywords)
                     
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "brief_id": brief_id,
@@ -400,37 +797,22 @@ class ContentAgent(BaseAgent):
             return {"status": "error", "message": str(e)}
             
     # Helper methods
+    def _link_keywords(self, node_id: str, keywords: List[str]) -> None:
+        """Connect a node to the knowledge graph nodes of the keywords it targets."""
+        graph = self.knowledge_graph.graph
+        keyword_ids = dict.fromkeys(f"keyword_{keyword.replace(' ', '_')}" for keyword in keywords)
+        
+        self.knowledge_graph.add_edges([
+            (node_id, keyword_id, {"type": "targets"})
+            for keyword_id in keyword_ids if keyword_id in graph
+        ])
+        
     def _get_content_template(self, content_type: str) -> Dict[str, Any]:
         """Get content template for a specific content type."""
         if content_type in self.content_templates:
             return self.content_templates[content_type]
             
-        # Default templates for common content types
-        default_templates = {
-            "blog": {
-                "structure": ["title", "introduction", "main_points", "conclusion"],
-                "title_format": "{topic}: {benefit} for {audience}",
-                "introduction_format": "Introduction about {topic} highlighting {pain_point} and {solution}.",
-                "main_points_format": "Main points about {topic} with {examples} and {statistics}.",
-                "conclusion_format": "Conclusion summarizing {key_points} with {call_to_action}."
-            },
-            "social": {
-                "structure": ["hook", "value", "call_to_action"],
-                "hook_format": "Attention-grabbing statement about {topic}.",
-                "value_format": "Value proposition related to {topic}.",
-                "call_to_action_format": "Call to action encouraging {desired_action}."
-            },
-            "email": {
-                "structure": ["subject", "greeting", "body", "closing", "signature"],
-                "subject_format": "{benefit} for {audience} with {topic}",
-                "greeting_format": "Hello {audience},",
-                "body_format": "Email body about {topic} highlighting {pain_point} and {solution}.",
-                "closing_format": "Closing with {call_to_action}.",
-                "signature_format": "Best regards,\n{sender_name}"
-            }
-        }
-        
-        return default_templates.get(content_type, {})
+        return DEFAULT_CONTENT_TEMPLATES.get(content_type, {})
         
     def _generate_content_from_template(self, 
                                        template: Dict[str, Any],
@@ -445,30 +827,19 @@ class ContentAgent(BaseAgent):
         if not template or "structure" not in template:
             return f"Generated content about {topic} using keywords: {', '.join(keywords)}."
             
+        values = {"topic": topic, "keywords": ", ".join(keywords)}
+        
         content_parts = []
         
         # Generate content based on template structure
         for part in template["structure"]:
             format_key = f"{part}_format"
             if format_key in template:
-                # Replace placeholders in the format
-                part_content = template[format_key]
-                part_content = part_content.replace("{topic}", topic)
-                
-                if "{keywords}" in part_content:
-                    part_content = part_content.replace("{keywords}", ", ".join(keywords))
-                    
-                # Add more placeholder replacements as needed
-                part_content = part_content.replace("{audience}", "target audience")
-                part_content = part_content.replace("{benefit}", "key benefit")
-                part_content = part_content.replace("{pain_point}", "common pain point")
-                part_content = part_content.replace("{solution}", "proposed solution")
-                part_content = part_content.replace("{examples}", "relevant examples")
-                part_content = part_content.replace("{statistics}", "supporting statistics")
-                part_content = part_content.replace("{key_points}", "key points")
-                part_content = part_content.replace("{call_to_action}", "call to action")
-                part_content = part_content.replace("{desired_action}", "desired action")
-                part_content = part_content.replace("{sender_name}", "Sender Name")
+                # Fill the per-call placeholders into the precompiled format
+                parts = _compile_format(template[format_key])
+                part_content = parts[0] + "".join(
+                    values[name] + text for name, text in zip(parts[1::2], parts[2::2])
+                )
                 
                 content_parts.append(part_content)
             else:
@@ -488,35 +859,46 @@ class ContentAgent(BaseAgent):
         return content
         
     def _analyze_content(self, content: str, content_type: str) -> Dict[str, Any]:
+        """Analyze content, reusing the analysis of content seen recently."""
+        key = (content, content_type)
+        
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            analysis = self._compute_content_analysis(content, content_type)
+            self._analysis_cache[key] = analysis
+            if len(self._analysis_cache) > ANALYSIS_CACHE_MAX_ENTRIES:
+                self._analysis_cache.popitem(last=False)
+        else:
+            self._analysis_cache.move_to_end(key)
+            
+        return dict(analysis)
+        
+    def _compute_content_analysis(self, content: str, content_type: str) -> Dict[str, Any]:
         """Analyze content."""
         # This is a simplified implementation
         # In a real system, this would use NLP to analyze content quality, readability, etc.
         
-        words = content.split()
-        sentences = content.split('.')
+        word_count = len(content.split())
+        sentence_count = content.count('.') + 1
+        avg_sentence_length = word_count / sentence_count
         
         analysis = {
-            "word_count": len(words),
-            "sentence_count": len(sentences),
-            "avg_sentence_length": len(words) / len(sentences) if sentences else 0,
-            "readability": self._calculate_readability(content),
+            "word_count": word_count,
+            "sentence_count": sentence_count,
+            "avg_sentence_length": avg_sentence_length,
+            "readability": self._calculate_readability(word_count, avg_sentence_length),
             "sentiment": self._analyze_sentiment(content),
             "content_type": content_type
         }
         
         return analysis
         
-    def _calculate_readability(self, content: str) -> float:
-        """Calculate readability score."""
+    def _calculate_readability(self, word_count: int, avg_sentence_length: float) -> float:
+        """Calculate readability score from precomputed word and sentence statistics."""
         # Simplified Flesch Reading Ease calculation
-        words = content.split()
-        sentences = content.split('.')
-        
-        if not words or not sentences:
+        if not word_count:
             return 0
             
-        avg_sentence_length = len(words) / len(sentences)
-        
         # Simplified calculation
         readability = 206.835 - (1.015 * avg_sentence_length)
         
@@ -527,13 +909,10 @@ class ContentAgent(BaseAgent):
         # This is a simplified implementation
         # In a real system, this would use NLP models for sentiment analysis
         
-        positive_words = ["good", "great", "excellent", "amazing", "wonderful", "best", "positive"]
-        negative_words = ["bad", "poor", "terrible", "worst", "negative", "awful", "horrible"]
+        tokens = WORD_PATTERN.findall(content.lower())
         
-        content_lower = content.lower()
-        
-        positive_count = sum(content_lower.count(word) for word in positive_words)
-        negative_count = sum(content_lower.count(word) for word in negative_words)
+        positive_count = sum(1 for token in tokens if token in POSITIVE_WORDS)
+        negative_count = sum(1 for token in tokens if token in NEGATIVE_WORDS)
         
         if positive_count > negative_count:
             return "positive"
@@ -548,35 +927,11 @@ class ContentAgent(BaseAgent):
                                              target_audience: str,
                                              optimization_goals: List[str]) -> List[Dict[str, Any]]:
         """Generate content optimization recommendations."""
-        recommendations = []
-        
-        # Check word count based on platform
-        if target_platform == "blog" and content_analysis["word_count"] < 500:
-            recommendations.append({
-                "type": "word_count",
-                "message": "Content is too short for a blog post. Aim for at least 1000 words for better engagement."
-            })
-        elif target_platform == "social" and content_analysis["word_count"] > 100:
-            recommendations.append({
-                "type": "word_count",
-                "message": "Content is too long for social media. Keep it under 100 words for better engagement."
-            })
-            
-        # Check readability
-        if content_analysis["readability"] < 50:
-            recommendations.append({
-                "type": "readability",
-                "message": "Content readability is low. Simplify sentences and use more common words."
-            })
-            
-        # Check sentiment based on goals
-        if "engagement" in optimization_goals and content_analysis["sentiment"] == "neutral":
-            recommendations.append({
-                "type": "sentiment",
-                "message": "Content sentiment is neutral. Consider using more emotionally engaging language for better engagement."
-            })
-            
-        return recommendations
+        return [
+            dict(recommendation)
+            for condition, recommendation in OPTIMIZATION_RULES
+            if condition(content_analysis, target_platform, optimization_goals)
+        ]
         
     def _apply_content_optimizations(self, content: str, recommendations: List[Dict[str, Any]]) -> str:
         """Apply content optimizations."""
@@ -602,82 +957,60 @@ class ContentAgent(BaseAgent):
                                   end_date: str,
                                   content_types: List[str],
                                   topics: List[str],
-                                  frequency: Dict[str, int]) -> List[Dict[str, Any]]:
+                                  frequency: Dict[str, int]) -> List[CalendarItem]:
         """Generate a content calendar."""
-        from datetime import datetime, timedelta
-        
         # Parse dates
-        start = datetime.fromisoformat(start_date)
-        end = datetime.fromisoformat(end_date)
-        
-        calendar = []
-        current_date = start
-        topic_index = 0
-        
-        while current_date <= end:
-            # Determine content type for this day
-            for content_type in content_types:
-                # Check if we should publish this content type on this day
-                # based on frequency
-                days_in_period = (end - start).days + 1
-                type_frequency = frequency.get(content_type, 1)
+        start = _parse_iso(start_date)
+        end = _parse_iso(end_date)
+        
+        days_in_period = (end - start).days + 1
+        if days_in_period <= 0:
+            return []
+            
+        # Publishing day offsets for each content type based on frequency
+        day_offsets = []
+        type_indices = []
+        for type_index, content_type in enumerate(content_types):
+            type_frequency = frequency.get(content_type, 1)
+            if type_frequency > 0:
+                publishing_interval = max(1, int(days_in_period / type_frequency))
+                offsets = np.arange(0, days_in_period, publishing_interval)
+                day_offsets.append(offsets)
+                type_indices.append(np.full(len(offsets), type_index))
                 
-                if type_frequency > 0 and days_in_period > 0:
-                    # Calculate if this is a publishing day for this content type
-                    publishing_interval = days_in_period / type_frequency
-                    days_since_start = (current_date - start).days
-                    
-                    if days_since_start % max(1, int(publishing_interval)) == 0:
-                        # Add to calendar
-                        topic = topics[topic_index % len(topics)]
-                        topic_index += 1
-                        
-                        calendar_item = {
-                            "date": current_date.isoformat(),
-                            "content_type": content_type,
-                            "topic": topic,
-                            "status": "planned"
-                        }
-                        
-                        calendar.append(calendar_item)
-                        
-            # Move to next day
-            current_date += timedelta(days=1)
-            
-        return calendar
-        
-    def _simulate_content_performance(self, content_id: str, metrics: List[str], period: str) -> Dict[str, Any]:
-        """Simulate content performance metrics."""
-        import random
-        
-        performance = {
-            "content_id": content_id,
-            "period": period
-        }
+        if not day_offsets:
+            return []
+            
+        # Order by day, keeping the content type order within each day
+        day_offsets = np.concatenate(day_offsets)
+        type_indices = np.concatenate(type_indices)
+        order = np.lexsort((type_indices, day_offsets))
+        
+        return [
+            CalendarItem(
+                date=(start + timedelta(days=offset)).isoformat(),
+                content_type=content_types[type_index],
+                topic=topics[topic_index % len(topics)],
+                status="planned"
+            )
+            for topic_index, (offset, type_index) in enumerate(zip(day_offsets[order].tolist(),
+                                                                   type_indices[order].tolist()))
+        ]
         
-        # Generate random metrics
+    def _simulate_content_performance(self, content_ids: List[str], metrics: List[str]) -> Dict[str, np.ndarray]:
+        """Simulate content performance metrics for a batch of content, one array per metric."""
+        columns = {}
         for metric in metrics:
-            if metric == "views":
-                performance[metric] = random.randint(100, 10000)
-            elif metric == "engagement":
-                performance[metric] = random.uniform(0.01, 0.2)
-            elif metric == "shares":
-                performance[metric] = random.randint(5, 500)
-            elif metric == "comments":
-                performance[metric] = random.randint(0, 100)
-            elif metric == "conversions":
-                performance[metric] = random.randint(1, 50)
-            elif metric == "time_on_page":
-                performance[metric] = random.uniform(10, 300)
+            low, high, integer = SIMULATED_METRIC_RANGES.get(metric, DEFAULT_SIMULATED_METRIC_RANGE)
+            if integer:
+                columns[metric] = self._rng.integers(low, high, size=len(content_ids), endpoint=True)
             else:
-                performance[metric] = random.randint(1, 100)
+                columns[metric] = self._rng.uniform(low, high, size=len(content_ids))
                 
-        return performance
+        return columns
         
     def _analyze_competitor_content(self, competitor: str, topic: str, content_type: str) -> Dict[str, Any]:
         """Analyze competitor content."""
-        import random
-        
         # This is a simplified implementation
         # In a real system, this would involve web scraping and content analysis
         
@@ -685,8 +1018,8 @@ class ContentAgent(BaseAgent):
             "competitor": competitor,
             "content_type": content_type,
             "topic": topic,
-            "word_count": random.randint(500, 3000),
-            "readability": random.uniform(50, 90),
+            "word_count": int(self._rng.integers(500, 3000, endpoint=True)),
+            "readability": float(self._rng.uniform(50, 90)),
             "key_points": ["Point 1", "Point 2", "Point 3"],
             "strengths": ["Strength 1", "Strength 2"],
             "weaknesses": ["Weakness 1", "Weakness 2"]
@@ -694,89 +1027,16 @@ class ContentAgent(BaseAgent):
         
     def _generate_content_outline(self, topic: str, content_type: str, keywords: List[str]) -> List[Dict[str, Any]]:
         """Generate a content outline."""
-        if content_type == "blog":
-            return [
-                {"section": "Introduction", "description": f"Introduction to {topic}"},
-                {"section": "What is {topic}", "description": f"Definition and explanation of {topic}"},
-                {"section": "Benefits of {topic}", "description": f"Key benefits and advantages of {topic}"},
-                {"section": "How to implement {topic}", "description": f"Step-by-step guide to implementing {topic}"},
-                {"section": "Case studies", "description": f"Real-world examples of {topic} in action"},
-                {"section": "Conclusion", "description": f"Summary and next steps for {topic}"}
-            ]
-        elif content_type == "social":
-            return [
-                {"section": "Hook", "description": f"Attention-grabbing statement about {topic}"},
-                {"section": "Value", "description": f"Key value proposition related to {topic}"},
-                {"section": "Call to Action", "description": f"Clear call to action related to {topic}"}
-            ]
-        elif content_type == "email":
-            return [
-                {"section": "Subject Line", "description": f"Compelling subject line about {topic}"},
-                {"section": "Introduction", "description": f"Brief introduction to {topic}"},
-                {"section": "Main Content", "description": f"Key information about {topic}"},
-                {"section": "Call to Action", "description": f"Clear call to action related to {topic}"},
-                {"section": "Closing", "description": f"Brief closing statement"}
-            ]
-        else:
-            return [
-                {"section": "Main Content", "description": f"Content about {topic}"}
-            ]
-            
+        return [
+            {"section": section.format(topic=topic), "description": description.format(topic=topic)}
+            for section, description in CONTENT_OUTLINES.get(content_type, DEFAULT_CONTENT_OUTLINE)
+        ]
+        
     def _recommend_tone_and_style(self, target_audience: str, content_type: str) -> Dict[str, Any]:
         """Recommend tone and style for content."""
         # Default recommendations based on content type
-        if content_type == "blog":
-            return {
-                "tone": "informative and conversational",
-                "style": "educational with practical examples",
-                "voice": "second person (you/your)",
-                "formality": "semi-formal"
-            }
-        elif content_type == "social":
-            return {
-                "tone": "engaging and concise",
-                "style": "direct and attention-grabbing",
-                "voice": "first person (we/our) or second person (you/your)",
-                "formality": "casual"
-            }
-        elif content_type == "email":
-            return {
-                "tone": "personal and direct",
-                "style": "clear and action-oriented",
-                "voice": "second person (you/your)",
-                "formality": "business casual"
-            }
-        else:
-            return {
-                "tone": "professional",
-                "style": "clear and concise",
-                "voice": "third person",
-                "formality": "formal"
-            }
-            
+        return dict(TONE_AND_STYLE.get(content_type, DEFAULT_TONE_AND_STYLE))
+        
     def _recommend_content_length(self, content_type: str) -> Dict[str, Any]:
         """Recommend content length based on content type."""
-        if content_type == "blog":
-            return {
-                "word_count": "1000-2000 words",
-                "sections": "5-7 sections",
-                "paragraphs_per_section": "2-4 paragraphs"
-            }
-        elif content_type == "social":
-            return {
-                "word_count": "50-100 words",
-                "sections": "1 section",
-                "paragraphs_per_section": "1-2 paragraphs"
-            }
-        elif content_type == "email":
-            return {
-                "word_count": "200-500 words",
-                "sections": "3-5 sections",
-                "paragraphs_per_section": "1-2 paragraphs"
-            }
-        else:
-            return {
-                "word_count": "500-1000 words",
-                "sections": "3-5 sections",
-                "paragraphs_per_section": "1-3 paragraphs"
-            }
+        return dict(CONTENT_LENGTHS.get(content_type, DEFAULT_CONTENT_LENGTH))
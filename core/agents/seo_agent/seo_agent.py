@@ -7,15 +7,98 @@ tasks, leveraging the existing SEO Content Generator capabilities.
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, Any, Optional, Tuple
+import copy
 import json
 import os
+import random
+import re
+import time
+from collections import Counter
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from core.agents.base_agent import BaseAgent
 
 # Configure logging (configured centrally in main application)
 logger = logging.getLogger(__name__)
 
+# Words as counted for keyword density
+WORD_PATTERN = re.compile(r"\w+")
+
+# Search intent signalled by words (or word prefixes) in a keyword, in order of precedence
+INTENT_PATTERN = re.compile(r"\b(how|guide|tutorial|buy|price|review|vs|comparison)")
+INTENT_BY_WORD = {
+    "how": "informational",
+    "guide": "informational",
+    "tutorial": "informational",
+    "buy": "commercial",
+    "price": "commercial",
+    "review": "commercial",
+    "vs": "comparison",
+    "comparison": "comparison"
+}
+INTENT_PRIORITY = ("informational", "commercial", "comparison")
+
+# Related keyword variations of a keyword (or one of its words)
+RELATED_KEYWORD_TEMPLATES = ("best {}", "{} guide", "{} tutorial")
+
+# Maximum number of keywords whose intent / related keywords are kept cached
+INTENT_CACHE_SIZE = 4096
+RELATED_KEYWORDS_CACHE_SIZE = 2048
+KEYWORD_IDS_CACHE_SIZE = 4096
+
+# Simulated per-domain/keyword data is reused for this many seconds
+SIMULATION_CACHE_TTL = 3600
+SIMULATION_CACHE_MAX_ENTRIES = 8192
+
+def _load_json(path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as file:
+            return orjson.loads(file.read())
+    with open(path, 'r') as file:
+        return json.load(file)
+
+def _dump_json(path: str, data: Any) -> None:
+    """Write data to a JSON file, using orjson when it is installed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w') as file:
+        json.dump(data, file)
+
+def _cached_simulation(method):
+    """Reuse a simulation method's result for the same arguments until it expires."""
+    @wraps(method)
+    def wrapper(self, *args):
+        return self._get_cached_simulation((method.__name__, *args), lambda: method(self, *args))
+    return wrapper
+
+@lru_cache(maxsize=KEYWORD_IDS_CACHE_SIZE)
+def _keyword_ids(keyword: str) -> Tuple[str, str]:
+    """Get the lowercase form and knowledge graph node ID of a keyword."""
+    return keyword.lower(), f"keyword_{keyword.replace(' ', '_')}"
+
+@lru_cache(maxsize=RELATED_KEYWORDS_CACHE_SIZE)
+def _related_keywords(keyword: str) -> Tuple[str, ...]:
+    """Generate related keywords, seeding the word choice with the keyword so results can be cached."""
+    words = keyword.split()
+    if len(words) <= 1:
+        return tuple(template.format(keyword) for template in RELATED_KEYWORD_TEMPLATES)
+        
+    rng = random.Random(keyword)
+    return tuple(template.format(rng.choice(words)) for template in RELATED_KEYWORD_TEMPLATES)
+
 class SEOAgent(BaseAgent):
     """
     Agent responsible for SEO-related tasks.
@@ -38,6 +121,13 @@ class SEOAgent(BaseAgent):
         super().__init__(config)
         self.keyword_database = {}
         self.seo_metrics = {}
+        
+        # Shared generator for simulated data; seed it for reproducible runs
+        self._rng = np.random.default_rng(config.get("simulation_seed"))
+        
+        # Simulated values by (simulation, *args) -> (stored_at, value)
+        self._simulation_cache = {}
+        
         logger.info("SEO Agent initialized")
         
     def _register_actions(self) -> None:
@@ -58,11 +148,12 @@ class SEOAgent(BaseAgent):
             Dict containing initialization status
         """
         try:
+            loop = asyncio.get_running_loop()
+            
             # Load keyword database if available
             keyword_db_path = self.config.get("keyword_database_path")
             if keyword_db_path and os.path.exists(keyword_db_path):
-                with open(keyword_db_path, 'r') as file:
-                    self.keyword_database = json.load(file)
+                self.keyword_database = await loop.run_in_executor(None, _load_json, keyword_db_path)
                     
             return {"status": "success", "message": "SEO Agent initialized successfully"}
         except Exception as e:
@@ -77,12 +168,12 @@ class SEOAgent(BaseAgent):
             Dict containing shutdown status
         """
         try:
+            loop = asyncio.get_running_loop()
+            
             # Save keyword database
             keyword_db_path = self.config.get("keyword_database_path")
             if keyword_db_path:
-                os.makedirs(os.path.dirname(keyword_db_path), exist_ok=True)
-                with open(keyword_db_path, 'w') as file:
-                    json.dump(self.keyword_database, file)
+                await loop.run_in_executor(None, _dump_json, keyword_db_path, self.keyword_database)
                     
             return {"status": "success", "message": "SEO Agent shut down successfully"}
         except Exception as e:
@@ -100,47 +191,44 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing keyword analysis results
         """
-        start_time = asyncio.get_event_loop().time()
-        results = {}
+        start_time = time.perf_counter()
         
         try:
-            for keyword in keywords:
-                # Check if we already have analysis for this keyword
-                if keyword in self.keyword_database:
-                    results[keyword] = self.keyword_database[keyword]
-                    continue
+            # Analyze keywords missing from the database in one batch
+            # In a real implementation, this would call external APIs or use ML models
+            missing = set(keywords).difference(self.keyword_database)
+            if missing:
+                new_keywords = [keyword for keyword in dict.fromkeys(keywords) if keyword in missing]
+                metrics = self._simulate_keyword_metrics(len(new_keywords))
+                for index, keyword in enumerate(new_keywords):
+                    # Store in database
+                    self.keyword_database[keyword] = {
+                        "keyword": keyword,
+                        "search_volume": metrics["search_volume"][index],
+                        "competition": metrics["competition"][index],
+                        "cpc": metrics["cpc"][index],
+                        "difficulty": metrics["difficulty"][index],
+                        "intent": self._analyze_intent(keyword),
+                        "related_keywords": self._generate_related_keywords(keyword)
+                    }
                     
-                # Simulate keyword analysis
-                # In a real implementation, this would call external APIs or use ML models
-                analysis = {
-                    "keyword": keyword,
-                    "search_volume": self._simulate_search_volume(keyword),
-                    "competition": self._simulate_competition(keyword),
-                    "cpc": self._simulate_cpc(keyword),
-                    "difficulty": self._simulate_difficulty(keyword),
-                    "intent": self._analyze_intent(keyword),
-                    "related_keywords": self._generate_related_keywords(keyword)
-                }
-                
-                # Store in database
-                self.keyword_database[keyword] = analysis
-                results[keyword] = analysis
+            results = {keyword: self.keyword_database[keyword] for keyword in keywords}
                 
             # Update knowledge graph
             if self.knowledge_graph:
-                for keyword, analysis in results.items():
-                    # Create or update keyword node
-                    keyword_id = f"keyword_{keyword.replace(' ', '_')}"
-                    self.knowledge_graph.add_node(keyword_id, {
-                        "type": "keyword",
-                        "name": keyword,
-                        "analysis": analysis
-                    })
-                    
-                    # Connect to keywords category
-                    self.knowledge_graph.add_edge("keywords", keyword_id, {"type": "contains"})
+                # Create or update keyword nodes
+                keyword_ids = [_keyword_ids(keyword)[1] for keyword in results]
+                self.knowledge_graph.add_nodes([
+                    (keyword_id, {"type": "keyword", "name": keyword, "analysis": analysis})
+                    for keyword_id, (keyword, analysis) in zip(keyword_ids, results.items())
+                ])
+                
+                # Connect to keywords category
+                self.knowledge_graph.add_edges([
+                    ("keywords", keyword_id, {"type": "contains"}) for keyword_id in keyword_ids
+                ])
                     
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "keywords_analyzed": len(keywords),
@@ -163,19 +251,16 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing optimized content
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
-            # Analyze content
-            content_analysis = self._analyze_content(content, target_keywords)
-            
-            # Generate optimization recommendations
-            recommendations = self._generate_optimization_recommendations(content_analysis, target_keywords)
+            # Analyze content and generate optimization recommendations
+            content_analysis, recommendations = self._analyze_content(content, target_keywords)
             
             # Apply optimizations
             optimized_content = self._apply_optimizations(content, recommendations)
             
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "original_content": content,
@@ -199,10 +284,21 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing competitor analysis results
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         results = {}
         
         try:
+            nodes = []
+            edges = []
+            
+            # Keywords with a knowledge graph node, checked once for all competitors
+            if self.knowledge_graph:
+                graph = self.knowledge_graph.graph
+                linked_keywords = {
+                    keyword: keyword_id for keyword in keywords
+                    if (keyword_id := _keyword_ids(keyword)[1]) in graph
+                }
+                
             for competitor in competitors:
                 # Simulate competitor analysis
                 # In a real implementation, this would involve web scraping and API calls
@@ -216,29 +312,32 @@ class SEOAgent(BaseAgent):
                 
                 results[competitor] = analysis
                 
-                # Update knowledge graph
+                # Collect knowledge graph updates
                 if self.knowledge_graph:
                     # Create or update competitor node
                     competitor_id = f"competitor_{competitor.replace('.', '_')}"
-                    self.knowledge_graph.add_node(competitor_id, {
+                    nodes.append((competitor_id, {
                         "type": "competitor",
                         "name": competitor,
                         "analysis": analysis
-                    })
+                    }))
                     
                     # Connect to competitors category
-                    self.knowledge_graph.add_edge("competitors", competitor_id, {"type": "contains"})
+                    edges.append(("competitors", competitor_id, {"type": "contains"}))
                     
                     # Connect to keywords
-                    for keyword, ranking in analysis["keyword_rankings"].items():
-                        keyword_id = f"keyword_{keyword.replace(' ', '_')}"
-                        if keyword_id in self.knowledge_graph.graph:
-                            self.knowledge_graph.add_edge(competitor_id, keyword_id, {
-                                "type": "ranks_for",
-                                "ranking": ranking
-                            })
-                    
-            execution_time = asyncio.get_event_loop().time() - start_time
+                    rankings = analysis["keyword_rankings"]
+                    edges.extend(
+                        (competitor_id, keyword_id, {"type": "ranks_for", "ranking": rankings[keyword]})
+                        for keyword, keyword_id in linked_keywords.items()
+                    )
+                            
+            # Update knowledge graph
+            if self.knowledge_graph:
+                self.knowledge_graph.add_nodes(nodes)
+                self.knowledge_graph.add_edges(edges)
+                
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "competitors_analyzed": len(competitors),
@@ -260,7 +359,7 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing SEO report
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
             # Simulate SEO report generation
@@ -275,7 +374,7 @@ class SEOAgent(BaseAgent):
                 "recommendations": self._generate_seo_recommendations(website)
             }
             
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "report": report,
@@ -296,15 +395,13 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing ranking tracking results
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
             # Simulate ranking tracking
             # In a real implementation, this would involve SERP API calls
-            rankings = {}
-            for keyword in keywords:
-                rankings[keyword] = self._simulate_keyword_ranking(website, keyword)
-                
+            rankings = self._simulate_keyword_rankings(website, keywords)
+            
             # Update SEO metrics
             if website not in self.seo_metrics:
                 self.seo_metrics[website] = {"rankings": {}}
@@ -321,19 +418,18 @@ class SEOAgent(BaseAgent):
                     "rankings": rankings
                 })
                 
-                # Connect to websites category
-                self.knowledge_graph.add_edge("websites", website_id, {"type": "contains"})
+                # Connect to websites category and keywords
+                edges = [("websites", website_id, {"type": "contains"})]
+                graph = self.knowledge_graph.graph
+                edges.extend(
+                    (website_id, keyword_id, {"type": "ranks_for", "ranking": ranking})
+                    for keyword, ranking in rankings.items()
+                    if (keyword_id := _keyword_ids(keyword)[1]) in graph
+                )
                 
-                # Connect to keywords
-                for keyword, ranking in rankings.items():
-                    keyword_id = f"keyword_{keyword.replace(' ', '_')}"
-                    if keyword_id in self.knowledge_graph.graph:
-                        self.knowledge_graph.add_edge(website_id, keyword_id, {
-                            "type": "ranks_for",
-                            "ranking": ranking
-                        })
-                    
-            execution_time = asyncio.get_event_loop().time() - start_time
+                self.knowledge_graph.add_edges(edges)
+                
+            execution_time = time.perf_counter() - start_time
             return {
                 "status": "success",
                 "website": website,
@@ -346,100 +442,76 @@ class SEOAgent(BaseAgent):
             return {"status": "error", "message": str(e)}
             
     # Simulation methods for development and testing
-    def _simulate_search_volume(self, keyword: str) -> int:
-        """Simulate search volume for a keyword."""
-        import random
-        return random.randint(100, 10000)
-        
-    def _simulate_competition(self, keyword: str) -> float:
-        """Simulate competition level for a keyword."""
-        import random
-        return round(random.random(), 2)
-        
-    def _simulate_cpc(self, keyword: str) -> float:
-        """Simulate cost per click for a keyword."""
-        import random
-        return round(random.uniform(0.5, 10.0), 2)
-        
-    def _simulate_difficulty(self, keyword: str) -> int:
-        """Simulate SEO difficulty for a keyword."""
-        import random
-        return random.randint(1, 100)
-        
-    def _analyze_intent(self, keyword: str) -> str:
+    def _simulate_keyword_metrics(self, count: int) -> Dict[str, List[Any]]:
+        """Simulate search volume, competition, cost per click and SEO difficulty for a batch of keywords."""
+        return {
+            "search_volume": self._rng.integers(100, 10000, size=count, endpoint=True).tolist(),
+            "competition": np.round(self._rng.random(count), 2).tolist(),
+            "cpc": np.round(self._rng.uniform(0.5, 10.0, size=count), 2).tolist(),
+            "difficulty": self._rng.integers(1, 100, size=count, endpoint=True).tolist()
+        }
+        
+    @staticmethod
+    @lru_cache(maxsize=INTENT_CACHE_SIZE)
+    def _analyze_intent(keyword: str) -> str:
         """Analyze search intent for a keyword."""
-        if "how" in keyword or "guide" in keyword or "tutorial" in keyword:
-            return "informational"
-        elif "buy" in keyword or "price" in keyword or "review" in keyword:
-            return "commercial"
-        elif "vs" in keyword or "comparison" in keyword:
-            return "comparison"
-        else:
-            return "navigational"
+        matched = {INTENT_BY_WORD[word] for word in INTENT_PATTERN.findall(keyword)}
+        return next((intent for intent in INTENT_PRIORITY if intent in matched), "navigational")
             
     def _generate_related_keywords(self, keyword: str) -> List[str]:
         """Generate related keywords."""
-        words = keyword.split()
-        related = []
-        
-        for i in range(3):
-            if len(words) > 1:
-                import random
-                idx = random.randint(0, len(words) - 1)
-                new_word = f"best {words[idx]}" if i == 0 else f"{words[idx]} guide" if i == 1 else f"{words[idx]} tutorial"
-                related.append(new_word)
-            else:
-                related.append(f"best {keyword}" if i == 0 else f"{keyword} guide" if i == 1 else f"{keyword} tutorial")
-                
-        return related
+        return list(_related_keywords(keyword))
         
-    def _analyze_content(self, content: str, target_keywords: List[str]) -> Dict[str, Any]:
-        """Analyze content for SEO."""
+    def _analyze_content(self, content: str, target_keywords: List[str]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Analyze content for SEO and generate optimization recommendations in the same pass."""
+        word_count = len(content.split())
         analysis = {
-            "word_count": len(content.split()),
+            "word_count": word_count,
             "keyword_density": {}
         }
-        
-        for keyword in target_keywords:
-            count = content.lower().count(keyword.lower())
-            density = count / analysis["word_count"] if analysis["word_count"] > 0 else 0
-            analysis["keyword_density"][keyword] = {
-                "count": count,
-                "density": round(density * 100, 2)
-            }
-            
-        return analysis
-        
-    def _generate_optimization_recommendations(self, content_analysis: Dict[str, Any], target_keywords: List[str]) -> List[Dict[str, Any]]:
-        """Generate content optimization recommendations."""
         recommendations = []
         
         # Check word count
-        if content_analysis["word_count"] < 300:
+        if word_count < 300:
             recommendations.append({
                 "type": "word_count",
                 "message": "Content is too short. Aim for at least 500 words for better SEO performance."
             })
             
-        # Check keyword density
-        for keyword, data in content_analysis["keyword_density"].items():
-            if data["count"] == 0:
+        content_lower = content.lower()
+        word_counts = Counter(WORD_PATTERN.findall(content_lower))
+        
+        for keyword in dict.fromkeys(target_keywords):
+            keyword_lower = _keyword_ids(keyword)[0]
+            # Single words are counted as whole words; phrases fall back to a substring scan
+            if WORD_PATTERN.fullmatch(keyword_lower):
+                count = word_counts[keyword_lower]
+            else:
+                count = content_lower.count(keyword_lower)
+            density = round(count / word_count * 100, 2) if word_count > 0 else 0
+            analysis["keyword_density"][keyword] = {
+                "count": count,
+                "density": density
+            }
+            
+            # Check keyword density
+            if count == 0:
                 recommendations.append({
                     "type": "missing_keyword",
                     "message": f"Keyword '{keyword}' is not present in the content."
                 })
-            elif data["density"] < 0.5:
+            elif density < 0.5:
                 recommendations.append({
                     "type": "low_keyword_density",
-                    "message": f"Keyword '{keyword}' has low density ({data['density']}%). Aim for 1-2%."
+                    "message": f"Keyword '{keyword}' has low density ({density}%). Aim for 1-2%."
                 })
-            elif data["density"] > 3:
+            elif density > 3:
                 recommendations.append({
                     "type": "keyword_stuffing",
-                    "message": f"Keyword '{keyword}' may be overstuffed ({data['density']}%). Keep it under 3%."
+                    "message": f"Keyword '{keyword}' may be overstuffed ({density}%). Keep it under 3%."
                 })
                 
-        return recommendations
+        return analysis, recommendations
         
     def _apply_optimizations(self, content: str, recommendations: List[Dict[str, Any]]) -> str:
         """Apply SEO optimizations to content."""
@@ -450,83 +522,100 @@ class SEOAgent(BaseAgent):
         
         return optimized_content
         
+    @_cached_simulation
     def _simulate_domain_authority(self, domain: str) -> int:
         """Simulate domain authority."""
-        import random
-        return random.randint(1, 100)
+        return int(self._rng.integers(1, 100, endpoint=True))
         
     def _simulate_keyword_rankings(self, domain: str, keywords: List[str]) -> Dict[str, int]:
-        """Simulate keyword rankings for a domain."""
-        import random
-        rankings = {}
+        """Simulate keyword rankings for a domain, reusing rankings that have not expired."""
+        now = time.time()
+        keys = {keyword: ("keyword_ranking", domain, keyword) for keyword in keywords}
         
-        for keyword in keywords:
-            rankings[keyword] = random.randint(1, 100)
-            
-        return rankings
+        # Read fresh rankings before storing new ones, since storing may evict
+        rankings = {}
+        missing = []
+        for key in dict.fromkeys(keys.values()):
+            entry = self._simulation_cache.get(key)
+            if entry is not None and now - entry[0] < SIMULATION_CACHE_TTL:
+                rankings[key] = entry[1]
+            else:
+                missing.append(key)
+                
+        # Draw rankings only for keywords without a fresh one
+        if missing:
+            drawn = self._rng.integers(1, 100, size=len(missing), endpoint=True).tolist()
+            rankings.update(zip(missing, drawn))
+            for key, ranking in zip(missing, drawn):
+                self._store_simulation(key, ranking, now)
+                
+        return {keyword: rankings[key] for keyword, key in keys.items()}
         
+    @_cached_simulation
     def _simulate_backlink_profile(self, domain: str) -> Dict[str, Any]:
         """Simulate backlink profile for a domain."""
-        import random
+        total, referring, dofollow, nofollow = self._rng.integers(
+            [100, 10, 50, 50], [10000, 1000, 5000, 5000], endpoint=True
+        ).tolist()
         return {
-            "total_backlinks": random.randint(100, 10000),
-            "referring_domains": random.randint(10, 1000),
-            "dofollow_links": random.randint(50, 5000),
-            "nofollow_links": random.randint(50, 5000)
+            "total_backlinks": total,
+            "referring_domains": referring,
+            "dofollow_links": dofollow,
+            "nofollow_links": nofollow
         }
         
+    @_cached_simulation
     def _analyze_content_strategy(self, domain: str) -> Dict[str, Any]:
         """Analyze content strategy for a domain."""
-        import random
+        avg_word_count, posts_per_month = self._rng.integers([300, 1], [2000, 10], endpoint=True).tolist()
         return {
             "content_types": ["blog", "product", "category"],
-            "avg_word_count": random.randint(300, 2000),
-            "publishing_frequency": f"{random.randint(1, 10)} per month",
+            "avg_word_count": avg_word_count,
+            "publishing_frequency": f"{posts_per_month} per month",
             "top_topics": ["topic1", "topic2", "topic3"]
         }
         
+    @_cached_simulation
     def _simulate_organic_traffic(self, domain: str, period: str) -> Dict[str, Any]:
         """Simulate organic traffic for a domain."""
-        import random
+        change, duration, bounce_rate = self._rng.uniform([-0.2, 60, 0.3], [0.5, 300, 0.8]).tolist()
         return {
-            "total_visits": random.randint(1000, 100000),
-            "change": random.uniform(-0.2, 0.5),
-            "avg_session_duration": random.uniform(60, 300),
-            "bounce_rate": random.uniform(0.3, 0.8)
+            "total_visits": int(self._rng.integers(1000, 100000, endpoint=True)),
+            "change": change,
+            "avg_session_duration": duration,
+            "bounce_rate": bounce_rate
         }
         
+    @_cached_simulation
     def _simulate_period_keyword_rankings(self, domain: str, period: str) -> Dict[str, List[int]]:
         """Simulate keyword rankings over a period."""
-        import random
         keywords = ["keyword1", "keyword2", "keyword3", "keyword4", "keyword5"]
-        rankings = {}
         
-        for keyword in keywords:
-            # Generate 4 weekly rankings
-            rankings[keyword] = [random.randint(1, 100) for _ in range(4)]
-            
-        return rankings
+        # Generate 4 weekly rankings per keyword
+        rankings = self._rng.integers(1, 100, size=(len(keywords), 4), endpoint=True)
+        return dict(zip(keywords, rankings.tolist()))
         
+    @_cached_simulation
     def _simulate_top_landing_pages(self, domain: str, period: str) -> List[Dict[str, Any]]:
         """Simulate top landing pages."""
-        import random
-        pages = []
+        page_count = 5
+        visits = self._rng.integers(100, 10000, size=page_count, endpoint=True).tolist()
+        bounce_rates = self._rng.uniform(0.3, 0.8, size=page_count).tolist()
+        times_on_page = self._rng.uniform(30, 300, size=page_count).tolist()
         
-        for i in range(5):
-            pages.append({
+        return [
+            {
                 "url": f"{domain}/page{i+1}",
-                "visits": random.randint(100, 10000),
-                "bounce_rate": random.uniform(0.3, 0.8),
-                "avg_time_on_page": random.uniform(30, 300)
-            })
-            
-        return pages
+                "visits": visits[i],
+                "bounce_rate": bounce_rates[i],
+                "avg_time_on_page": times_on_page[i]
+            }
+            for i in range(page_count)
+        ]
         
+    @_cached_simulation
     def _simulate_seo_issues(self, domain: str) -> List[Dict[str, Any]]:
         """Simulate SEO issues for a domain."""
-        import random
-        issues = []
-        
         issue_types = [
             "missing_meta_descriptions",
             "duplicate_title_tags",
@@ -534,16 +623,20 @@ class SEOAgent(BaseAgent):
             "slow_page_speed",
             "missing_alt_tags"
         ]
+        severities = ["low", "medium", "high"]
         
-        for issue_type in issue_types:
-            if random.random() > 0.5:
-                issues.append({
-                    "type": issue_type,
-                    "count": random.randint(1, 20),
-                    "severity": random.choice(["low", "medium", "high"])
-                })
-                
-        return issues
+        found = (self._rng.random(len(issue_types)) > 0.5).tolist()
+        counts = self._rng.integers(1, 20, size=len(issue_types), endpoint=True).tolist()
+        severity_indices = self._rng.integers(0, len(severities), size=len(issue_types)).tolist()
+        
+        return [
+            {
+                "type": issue_type,
+                "count": counts[i],
+                "severity": severities[severity_indices[i]]
+            }
+            for i, issue_type in enumerate(issue_types) if found[i]
+        ]
         
     def _generate_seo_recommendations(self, domain: str) -> List[str]:
         """Generate SEO recommendations for a domain."""
@@ -555,7 +648,29 @@ class SEOAgent(BaseAgent):
             "Implement structured data markup"
         ]
         
-    def _simulate_keyword_ranking(self, domain: str, keyword: str) -> int:
-        """Simulate keyword ranking for a domain."""
-        import random
-        return random.randint(1, 100)
+    def _get_cached_simulation(self, key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        """
+        Return a simulated value, rebuilding it once it expires.
+        
+        Args:
+            key: Simulation name followed by its arguments
+            build: Callable producing the value
+            
+        Returns:
+            Copy of the simulated value, so callers cannot mutate the cache
+        """
+        now = time.time()
+        entry = self._simulation_cache.get(key)
+        if entry is not None and now - entry[0] < SIMULATION_CACHE_TTL:
+            return copy.deepcopy(entry[1])
+            
+        value = build()
+        self._store_simulation(key, value, now)
+        return copy.deepcopy(value)
+        
+    def _store_simulation(self, key: Tuple[Any, ...], value: Any, stored_at: float) -> None:
+        """Store a simulated value, evicting the oldest entry when the cache is full."""
+        self._simulation_cache.pop(key, None)
+        self._simulation_cache[key] = (stored_at, value)
+        if len(self._simulation_cache) > SIMULATION_CACHE_MAX_ENTRIES:
+            del self._simulation_cache[next(iter(self._simulation_cache))]
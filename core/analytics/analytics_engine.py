@@ -27,7 +27,7 @@ class AnalyticsEngine:
             config: Configuration dictionary (optional)
         """
         self.config = config or {}
-        self.data_sources = []
+        self.data_sources = {}  # Source name -> data source configuration
         self.metrics = {}
         logger.info("Analytics Engine initialized")
         
@@ -35,6 +35,8 @@ class AnalyticsEngine:
         """
         Add a data source to the analytics engine.
         
+        A source with the same name as an existing one replaces it.
+        
         Args:
             source: Data source configuration
             
@@ -45,7 +47,7 @@ class AnalyticsEngine:
             logger.error("Invalid data source configuration")
             return False
             
-        self.data_sources.append(source)
+        self.data_sources[source["name"]] = source
         logger.info(f"Added data source: {source['name']} ({source['type']})")
         return True
         
@@ -63,10 +65,14 @@ class AnalyticsEngine:
         # For now, return simulated data
         
         # Filter data sources if source_name is provided
-        sources = [s for s in self.data_sources if source_name is None or s["name"] == source_name]
-        if not sources and source_name:
-            logger.warning(f"Data source not found: {source_name}")
-            return {}
+        if source_name:
+            source = self.data_sources.get(source_name)
+            if source is None:
+                logger.warning(f"Data source not found: {source_name}")
+                return {}
+            sources = [source]
+        else:
+            sources = self.data_sources.values()
             
         # Collect metrics from each source
         collected_metrics = {}
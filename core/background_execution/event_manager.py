@@ -7,7 +7,9 @@ allowing components to publish and subscribe to events.
 
 import logging
 import asyncio
-from typing import Dict, List, Callable, Any, Optional, Set
+from collections import Counter, deque
+from itertools import islice
+from typing import Dict, List, Callable, Any, Optional, Set, Tuple
 from datetime import datetime
 import json
 import uuid
@@ -33,9 +35,10 @@ class EventManager:
             config: Configuration dictionary (optional)
         """
         self.config = config or {}
-        self.subscribers = {}  # Event name -> list of subscribers
-        self.event_history = {}  # Event name -> list of recent events
+        self.subscribers = {}  # Event name -> {subscriber ID: (callback, is_coroutine)}
+        self.event_history = {}  # Event name -> bounded deque of recent events
         self.history_limit = self.config.get('event_history_limit', 100)
+        self._event_counts = Counter()  # Event name -> number of events published
         self.analytics_engine = None
         
         # Initialize analytics engine if configured
@@ -71,7 +74,10 @@ class EventManager:
         if event_name not in self.subscribers:
             self.subscribers[event_name] = {}
             
-        self.subscribers[event_name][subscriber_id] = callback
+        # Resolve the sync/async split once here rather than on every publish
+        self.subscribers[event_name][subscriber_id] = (
+            callback, asyncio.iscoroutinefunction(callback)
+        )
         logger.info(f"Subscribed {subscriber_id} to event: {event_name}")
         
         return subscriber_id
@@ -121,16 +127,13 @@ class EventManager:
             'timestamp': datetime.now().isoformat()
         }
         
-        # Store in event history
-        if event_name not in self.event_history:
-            self.event_history[event_name] = []
+        # Store in event history; the deque evicts the oldest entry itself
+        history = self.event_history.get(event_name)
+        if history is None:
+            history = self.event_history[event_name] = deque(maxlen=self.history_limit)
             
-        self.event_history[event_name].append(event)
+        history.append(event)
         
-        # Trim history if needed
-        if len(self.event_history[event_name]) > self.history_limit:
-            self.event_history[event_name] = self.event_history[event_name][-self.history_limit:]
-            
         # Track event in analytics if available
         if self.analytics_engine:
             try:
@@ -138,50 +141,15 @@ class EventManager:
             except Exception as e:
                 logger.error(f"Error tracking event in analytics: {e}")
                 
-        # Notify subscribers
+        # Notify subscribers and wildcard subscribers in one batch; the
+        # snapshot lets a callback unsubscribe itself while we dispatch
+        subscribers = []
+        for subs in (self.subscribers.get(event_name), self.subscribers.get('*')):
+            if subs:
+                subscribers.extend(subs.items())
+                
         results = {}
-        if event_name in self.subscribers:
-            for subscriber_id, callback in self.subscribers[event_name].items():
-                try:
-                    logger.debug(f"Notifying subscriber {subscriber_id} of event: {event_name}")
-                    
-                    if asyncio.iscoroutinefunction(callback):
-                        result = await callback(event)
-                    else:
-                        result = callback(event)
-                        
-                    results[subscriber_id] = {
-                        'status': 'success',
-                        'result': result
-                    }
-                except Exception as e:
-                    logger.error(f"Error notifying subscriber {subscriber_id}: {e}")
-                    results[subscriber_id] = {
-                        'status': 'error',
-                        'message': str(e)
-                    }
-                    
-        # Also notify wildcard subscribers
-        if '*' in self.subscribers:
-            for subscriber_id, callback in self.subscribers['*'].items():
-                try:
-                    logger.debug(f"Notifying wildcard subscriber {subscriber_id} of event: {event_name}")
-                    
-                    if asyncio.iscoroutinefunction(callback):
-                        result = await callback(event)
-                    else:
-                        result = callback(event)
-                        
-                    results[subscriber_id] = {
-                        'status': 'success',
-                        'result': result
-                    }
-                except Exception as e:
-                    logger.error(f"Error notifying wildcard subscriber {subscriber_id}: {e}")
-                    results[subscriber_id] = {
-                        'status': 'error',
-                        'message': str(e)
-                    }
+        await self._dispatch(subscribers, event, results)
                     
         logger.info(f"Published event: {event_name}, notified {len(results)} subscribers")
         return {
@@ -189,6 +157,60 @@ class EventManager:
             'results': results
         }
         
+    async def _dispatch(self, subscribers: List[Tuple[str, Tuple[Callable, bool]]],
+                        event: Dict[str, Any], results: Dict[str, Any]):
+        """
+        Notify subscribers of an event.
+        
+        Synchronous callbacks run inline; coroutine callbacks run
+        concurrently so slow subscribers do not delay each other.
+        
+        Args:
+            subscribers: List of (subscriber ID, (callback, is_coroutine)) pairs
+            event: Event dictionary
+            results: Dictionary to store per-subscriber results in
+        """
+        if not subscribers:
+            return
+            
+        event_name = event['name']
+        outcomes = [None] * len(subscribers)
+        pending = []
+        
+        for index, (subscriber_id, (callback, is_coroutine)) in enumerate(subscribers):
+            logger.debug(f"Notifying subscriber {subscriber_id} of event: {event_name}")
+            
+            if is_coroutine:
+                pending.append((index, callback))
+                continue
+                
+            try:
+                outcomes[index] = callback(event)
+            except Exception as e:
+                outcomes[index] = e
+                
+        if pending:
+            gathered = await asyncio.gather(
+                *(callback(event) for _, callback in pending),
+                return_exceptions=True
+            )
+            for (index, _), outcome in zip(pending, gathered):
+                outcomes[index] = outcome
+                
+        # Record results in subscription order
+        for (subscriber_id, _), outcome in zip(subscribers, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error notifying subscriber {subscriber_id}: {outcome}")
+                results[subscriber_id] = {
+                    'status': 'error',
+                    'message': str(outcome)
+                }
+            else:
+                results[subscriber_id] = {
+                    'status': 'success',
+                    'result': outcome
+                }
+                
     def _track_event_in_analytics(self, event: Dict[str, Any]):
         """
         Track an event in the analytics engine.
@@ -199,14 +221,16 @@ class EventManager:
         if not self.analytics_engine:
             return
             
-        # Add event as a data source
-        source_name = f"event_{event['name']}"
-        source_type = "event"
+        event_name = event['name']
+        self._event_counts[event_name] += 1
         
+        # One data source per event name; re-adding it replaces the previous one
+        source_name = f"event_{event_name}"
         self.analytics_engine.add_data_source({
             "name": source_name,
-            "type": source_type,
-            "event": event
+            "type": "event",
+            "event": event,
+            "count": self._event_counts[event_name]
         })
         
         # Collect metrics for this event
@@ -227,15 +251,29 @@ class EventManager:
         if event_name:
             if event_name not in self.event_history:
                 return {event_name: []}
-            return {event_name: self.event_history[event_name][-limit:]}
+            return {event_name: self._recent_events(self.event_history[event_name], limit)}
             
         # Return history for all events
         result = {}
         for name, events in self.event_history.items():
-            result[name] = events[-limit:]
+            result[name] = self._recent_events(events, limit)
             
         return result
         
+    @staticmethod
+    def _recent_events(events: deque, limit: int) -> List[Dict[str, Any]]:
+        """
+        Return the newest events from a history deque, oldest first.
+        
+        Args:
+            events: History deque for one event name
+            limit: Maximum number of events to return
+            
+        Returns:
+            List of at most ``limit`` events
+        """
+        return list(islice(events, max(0, len(events) - limit), None))
+        
     def get_subscriber_count(self, event_name: Optional[str] = None) -> Dict[str, int]:
         """
         Get the number of subscribers for events.
@@ -263,7 +301,7 @@ class EventManager:
         """
         if event_name:
             if event_name in self.event_history:
-                self.event_history[event_name] = []
+                self.event_history[event_name] = deque(maxlen=self.history_limit)
                 logger.info(f"Cleared history for event: {event_name}")
         else:
             self.event_history = {}
@@ -8,7 +8,7 @@ about websites, industry, competitors, and marketing performance.
 import logging
 import json
 import os
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 import networkx as nx
 from datetime import datetime
 import pandas as pd
@@ -103,6 +103,33 @@ class MarketingKnowledgeGraph:
             logger.error(f"Failed to add node {node_id}: {str(e)}")
             return False
             
+    def add_nodes(self, nodes: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Add or update several nodes in the knowledge graph in one call.
+        
+        Args:
+            nodes: (node_id, attributes) tuples
+            
+        Returns:
+            Number of nodes added
+        """
+        if not nodes:
+            return 0
+            
+        timestamp = datetime.now().isoformat()
+        
+        try:
+            self.graph.add_nodes_from(
+                (node_id, {"created_at": timestamp, **attributes, "updated_at": timestamp})
+                for node_id, attributes in nodes
+            )
+            self.last_updated = datetime.now()
+            logger.debug(f"Added {len(nodes)} nodes")
+            return len(nodes)
+        except Exception as e:
+            logger.error(f"Failed to add nodes: {str(e)}")
+            return 0
+            
     def update_node(self, node_id: str, attributes: Dict[str, Any]) -> bool:
         """
         Update a node in the knowledge graph.
@@ -171,6 +198,39 @@ class MarketingKnowledgeGraph:
             logger.error(f"Failed to add edge {source_id} -> {target_id}: {str(e)}")
             return False
             
+    def add_edges(self, edges: List[Tuple[str, str, Dict[str, Any]]]) -> int:
+        """
+        Add several edges to the knowledge graph in one call.
+        
+        Edges whose source or target node does not exist are skipped.
+        
+        Args:
+            edges: (source_id, target_id, attributes) tuples
+            
+        Returns:
+            Number of edges added
+        """
+        timestamp = datetime.now().isoformat()
+        
+        valid_edges = []
+        for source_id, target_id, attributes in edges:
+            if source_id not in self.graph or target_id not in self.graph:
+                logger.error(f"Edge {source_id} -> {target_id} references a missing node")
+                continue
+            valid_edges.append((source_id, target_id, {"created_at": timestamp, **attributes, "updated_at": timestamp}))
+            
+        if not valid_edges:
+            return 0
+            
+        try:
+            self.graph.add_edges_from(valid_edges)
+            self.last_updated = datetime.now()
+            logger.debug(f"Added {len(valid_edges)} edges")
+            return len(valid_edges)
+        except Exception as e:
+            logger.error(f"Failed to add edges: {str(e)}")
+            return 0
+            
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a node from the knowledge graph.
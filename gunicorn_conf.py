@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for the GAMS API Simulator.
+
+Usage:
+    gunicorn -c gunicorn_conf.py "api_simulator:create_app()"
+
+The simulated data lives in process memory, so writes (start/stop, approvals,
+campaign status, cycle advances) are only seen by the worker that served them.
+Run a single worker and scale with threads, which share the data under
+api_simulator.data_lock. Raising GAMS_API_WORKERS above 1 gives each worker its
+own diverging copy of the data.
+"""
+
+import os
+
+bind = os.environ.get("GAMS_API_BIND", "0.0.0.0:5050")
+workers = int(os.environ.get("GAMS_API_WORKERS", 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GAMS_API_THREADS", 2 * (os.cpu_count() or 1) + 1))
+
+# Build the app (and its simulated dataset) in the master before forking
+preload_app = True
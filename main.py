@@ -34,6 +34,7 @@ from core.orchestrator.orchestrator import MarketingOrchestrator
 from core.knowledge_graph.knowledge_graph import MarketingKnowledgeGraph
 from core.agents.seo_agent.seo_agent import SEOAgent
 from core.agents.content_agent.content_agent import ContentAgent
+from core.agents.base_agent import close_mcp_client
 
 class MarketingAgentApp:
     """
@@ -253,6 +254,9 @@ class MarketingAgentApp:
                 logger.info(f"Shutting down {agent_name} Agent")
                 await agent.shutdown()
                 
+            # Close the pooled MCP connections the agents shared
+            await close_mcp_client()
+            
             # Save knowledge graph
             if self.knowledge_graph:
                 logger.info("Saving Knowledge Graph")
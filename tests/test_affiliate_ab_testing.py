@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Tests for the A/B test statistics used by the Affiliate Marketing Agent.
+"""
+
+import os
+import sys
+import unittest
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.agents.affiliate_agent.affiliate_agent import two_proportion_z_test
+
+
+class TestTwoProportionZTest(unittest.TestCase):
+    """Test suite for two_proportion_z_test."""
+
+    def test_known_values(self):
+        """Test against a hand-computed pooled z-test."""
+        # p_a = 0.12, p_b = 0.10, pooled = 0.11 over 2000 trials each
+        z, p_value = two_proportion_z_test(240, 2000, 200, 2000)
+        self.assertAlmostEqual(z, 2.0212, places=3)
+        self.assertAlmostEqual(p_value, 0.04325, places=4)
+
+    def test_direction(self):
+        """Test that swapping the groups flips the sign but not the p-value."""
+        z_ab, p_ab = two_proportion_z_test(30, 100, 20, 100)
+        z_ba, p_ba = two_proportion_z_test(20, 100, 30, 100)
+        self.assertAlmostEqual(z_ab, -z_ba)
+        self.assertAlmostEqual(p_ab, p_ba)
+
+    def test_degenerate_inputs(self):
+        """Test that empty groups and zero variance are never significant."""
+        self.assertEqual(two_proportion_z_test(0, 0, 5, 100), (0.0, 1.0))
+        self.assertEqual(two_proportion_z_test(0, 100, 0, 100), (0.0, 1.0))
+        self.assertEqual(two_proportion_z_test(100, 100, 50, 50), (0.0, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the search and analysis result caches of the Affiliate Marketing Agent.
+"""
+
+import os
+import sys
+import unittest
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.agents.affiliate_agent.affiliate_agent import AffiliateAgent
+from core.agents.base_agent import BaseAgent
+
+
+class NamedBaseAgent(BaseAgent):
+    """Accept the agent name AffiliateAgent passes up, which BaseAgent does not take."""
+
+    def __init__(self, name, config):
+        super().__init__(config)
+
+
+class TestAffiliateAgent(AffiliateAgent, NamedBaseAgent):
+    """AffiliateAgent with the lifecycle hooks the tests do not need."""
+
+    async def initialize(self):
+        return {"status": "success"}
+
+    async def shutdown(self):
+        return {"status": "success"}
+
+
+def make_product(product_id, platform="amazon", price=50.0):
+    """Build a complete product as returned by a search."""
+    return {
+        "id": product_id,
+        "name": f"Product {product_id}",
+        "platform": platform,
+        "category": "fitness",
+        "price": price,
+        "commission_rate": 20.0,
+        "conversion_rate": 2.5,
+        "popularity": 6.0
+    }
+
+
+class TestAffiliateCaches(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the affiliate agent's result caches."""
+
+    def setUp(self):
+        """Create an agent whose MCP calls are answered by self.responses."""
+        self.agent = TestAffiliateAgent({"name": "affiliate"})
+        self.responses = {}
+        self.mcp_calls = 0
+
+        async def fake_call_mcp(server, method, params):
+            self.mcp_calls += 1
+            return self.responses[params["platform"]]()
+
+        self.agent.call_mcp = fake_call_mcp
+
+    async def test_search_hit_is_not_affected_by_caller_changes(self):
+        """Test that modifying a returned result leaves the cached one intact."""
+        # Arrange
+        self.responses["amazon"] = lambda: {"status": "success", "products": [make_product("p1")]}
+        params = {"platform": "amazon", "category": "fitness"}
+
+        # Act
+        first = await self.agent.search_products(params)
+        first["products"].clear()
+        second = await self.agent.search_products(params)
+        second["products"][0]["price"] = 0
+        third = await self.agent.search_products(params)
+
+        # Assert
+        self.assertEqual(first["cache"], "MISS")
+        self.assertEqual(third["cache"], "HIT")
+        self.assertEqual(self.mcp_calls, 1)
+        self.assertEqual(third["products"], [make_product("p1")])
+
+    async def test_partial_search_failure_is_not_cached(self):
+        """Test that a multi-platform search with a failed platform is retried."""
+        # Arrange
+        outcomes = [{"status": "error", "message": "timeout"},
+                    {"status": "success", "products": [make_product("p2", "clickbank")]}]
+        self.responses["amazon"] = lambda: {"status": "success", "products": [make_product("p1")]}
+        self.responses["clickbank"] = lambda: outcomes.pop(0)
+        params = {"platforms": ["amazon", "clickbank"]}
+
+        # Act
+        first = await self.agent.search_products(params)
+        second = await self.agent.search_products(params)
+        third = await self.agent.search_products(params)
+
+        # Assert
+        self.assertEqual(first["errors"], {"clickbank": "timeout"})
+        self.assertEqual(second["cache"], "MISS")
+        self.assertEqual(second["errors"], {})
+        self.assertEqual(len(second["products"]), 2)
+        self.assertEqual(third["cache"], "HIT")
+
+    async def test_analysis_hit_is_not_affected_by_caller_changes(self):
+        """Test that modifying a returned analysis leaves the cached one intact."""
+        # Arrange
+        self.agent._add_product(make_product("p1"))
+        params = {"product_id": "p1"}
+
+        # Act
+        first = await self.agent.analyze_product(params)
+        expected_strengths = list(first["analysis"]["strengths"])
+        first["analysis"]["strengths"].append("Edited by caller")
+        first["analysis"]["product"]["price"] = 0
+        second = await self.agent.analyze_product(params)
+
+        # Assert
+        self.assertEqual(first["cache"], "MISS")
+        self.assertEqual(second["cache"], "HIT")
+        self.assertEqual(second["analysis"]["strengths"], expected_strengths)
+        self.assertEqual(second["analysis"]["product"]["price"], 50.0)
+
+    async def test_replacing_a_product_only_invalidates_its_analysis(self):
+        """Test that re-adding a product recomputes its analysis but not others."""
+        # Arrange
+        self.agent._add_product(make_product("p1"))
+        self.agent._add_product(make_product("p2"))
+        await self.agent.analyze_product({"product_id": "p1"})
+        await self.agent.analyze_product({"product_id": "p2"})
+
+        # Act
+        self.agent._add_product(make_product("p1", price=100.0))
+        replaced = await self.agent.analyze_product({"product_id": "p1"})
+        untouched = await self.agent.analyze_product({"product_id": "p2"})
+
+        # Assert
+        self.assertEqual(replaced["cache"], "MISS")
+        self.assertEqual(replaced["analysis"]["product"]["price"], 100.0)
+        self.assertEqual(untouched["cache"], "HIT")
+
+
+if __name__ == "__main__":
+    unittest.main()
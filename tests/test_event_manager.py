@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for subscriber dispatch in the Event Manager.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.background_execution.event_manager import EventManager
+
+
+class TestEventManagerDispatch(unittest.IsolatedAsyncioTestCase):
+    """Test suite for EventManager.publish subscriber dispatch."""
+
+    def setUp(self):
+        """Create an event manager without analytics tracking."""
+        self.event_manager = EventManager({'analytics_integration': {'enabled': False}})
+
+    async def test_results_follow_subscription_order(self):
+        """Test that sync, async and wildcard results keep subscription order."""
+        # Arrange
+        async def async_ok(event):
+            await asyncio.sleep(0.01)
+            return 'async'
+
+        self.event_manager.subscribe('ping', async_ok, 'first')
+        self.event_manager.subscribe('ping', lambda event: 'sync', 'second')
+        self.event_manager.subscribe('*', lambda event: event['name'], 'wildcard')
+
+        # Act
+        result = await self.event_manager.publish('ping')
+
+        # Assert
+        self.assertEqual(list(result['results']), ['first', 'second', 'wildcard'])
+        self.assertEqual(result['results']['first'], {'status': 'success', 'result': 'async'})
+        self.assertEqual(result['results']['second'], {'status': 'success', 'result': 'sync'})
+        self.assertEqual(result['results']['wildcard'], {'status': 'success', 'result': 'ping'})
+
+    async def test_errors_are_mapped_per_subscriber(self):
+        """Test that a failing subscriber does not affect the others."""
+        # Arrange
+        def sync_error(event):
+            raise ValueError('sync failure')
+
+        async def async_error(event):
+            raise RuntimeError('async failure')
+
+        self.event_manager.subscribe('ping', sync_error, 'sync')
+        self.event_manager.subscribe('ping', async_error, 'async')
+        self.event_manager.subscribe('ping', lambda event: 'ok', 'ok')
+
+        # Act
+        result = await self.event_manager.publish('ping')
+
+        # Assert
+        self.assertEqual(result['results'], {
+            'sync': {'status': 'error', 'message': 'sync failure'},
+            'async': {'status': 'error', 'message': 'async failure'},
+            'ok': {'status': 'success', 'result': 'ok'}
+        })
+
+    async def test_async_subscribers_run_concurrently(self):
+        """Test that every coroutine subscriber starts before any of them finishes."""
+        # Arrange
+        subscriber_count = 5
+        started = []
+        all_started = asyncio.Event()
+
+        async def wait_for_others(event):
+            started.append(event['name'])
+            if len(started) == subscriber_count:
+                all_started.set()
+            # Awaiting subscribers one at a time would never get past this
+            await all_started.wait()
+            return len(started)
+
+        for index in range(subscriber_count):
+            self.event_manager.subscribe('ping', wait_for_others, f'subscriber_{index}')
+
+        # Act
+        result = await asyncio.wait_for(self.event_manager.publish('ping'), timeout=1)
+
+        # Assert
+        for outcome in result['results'].values():
+            self.assertEqual(outcome, {'status': 'success', 'result': subscriber_count})
+
+    async def test_subscriber_can_unsubscribe_itself(self):
+        """Test that unsubscribing during dispatch does not break the publish."""
+        # Arrange
+        def unsubscribe_once(event):
+            self.event_manager.unsubscribe('ping', 'once')
+            return 'done'
+
+        self.event_manager.subscribe('ping', unsubscribe_once, 'once')
+        self.event_manager.subscribe('ping', lambda event: 'ok', 'other')
+
+        # Act
+        first = await self.event_manager.publish('ping')
+        second = await self.event_manager.publish('ping')
+
+        # Assert
+        self.assertEqual(list(first['results']), ['once', 'other'])
+        self.assertEqual(list(second['results']), ['other'])
+
+
+if __name__ == "__main__":
+    unittest.main()